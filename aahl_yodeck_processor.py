@@ -68,11 +68,11 @@ class AAHLDataProcessor:
         schedule_json = self.data_dir / "schedule.json"
 
         if schedule_json.exists():
-            with open(schedule_json, 'r') as f:
+            with open(schedule_json, 'r', encoding='utf-8') as f:
                 return json.load(f)
         elif schedule_csv.exists():
             schedule = []
-            with open(schedule_csv, 'r') as f:
+            with open(schedule_csv, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     schedule.append(row)
@@ -93,11 +93,11 @@ class AAHLDataProcessor:
         stats_json = self.data_dir / "player_stats.json"
 
         if stats_json.exists():
-            with open(stats_json, 'r') as f:
+            with open(stats_json, 'r', encoding='utf-8') as f:
                 return json.load(f)
         elif stats_csv.exists():
             stats = []
-            with open(stats_csv, 'r') as f:
+            with open(stats_csv, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     stats.append(row)
@@ -110,11 +110,11 @@ class AAHLDataProcessor:
         standings_json = self.data_dir / "standings.json"
 
         if standings_json.exists():
-            with open(standings_json, 'r') as f:
+            with open(standings_json, 'r', encoding='utf-8') as f:
                 return json.load(f)
         elif standings_csv.exists():
             standings = []
-            with open(standings_csv, 'r') as f:
+            with open(standings_csv, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     standings.append(row)
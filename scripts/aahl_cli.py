@@ -6,10 +6,12 @@ Command-line interface for the aahlscraper package.
 from __future__ import annotations
 
 import argparse
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List
-import json
+from typing import Callable, Dict, Iterable, List, Tuple
 from importlib import resources
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -23,19 +25,47 @@ from aahlscraper import (
     run_diagnostics,
     summarize_recommendation,
 )
-from aahlscraper.exporters import export_csv, export_json
+from aahlscraper.cache import ResponseCache
+from aahlscraper.exporters import export_csv, export_json, export_json_stream, write_json
+from aahlscraper.http_scraper import build_session
 from aahlscraper.utils import parse_game_date
 
+_SESSION = None
 
-def _build_scraper(backend: str, team_id: str):
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = build_session()
+    return _SESSION
+
+
+def _build_scraper(backend: str, team_id: str, cache: ResponseCache | None = None):
     if backend == "http":
-        return AmherstHockeyScraper(team_id=team_id)
+        return AmherstHockeyScraper(team_id=team_id, session=_get_session(), cache=cache)
     return AmherstHockeyPlaywrightScraper(team_id=team_id)
 
 
-def _export_records(records: List[Dict[str, str]], outdir: Path, basename: str, *, emit_json: bool, emit_csv: bool) -> None:
+@lru_cache(maxsize=None)
+def _teams_resource():
+    return resources.files("aahlscraper.data").joinpath("teams.json")
+
+
+def _json_name(basename: str, compress: bool) -> str:
+    return f"{basename}.json.zst" if compress else f"{basename}.json"
+
+
+def _export_records(
+    records: List[Dict[str, str]],
+    outdir: Path,
+    basename: str,
+    *,
+    emit_json: bool,
+    emit_csv: bool,
+    compress: bool = False,
+) -> None:
     if emit_json:
-        export_json(records, outdir / f"{basename}.json")
+        export_json(records, outdir / _json_name(basename, compress))
     if emit_csv:
         export_csv(records, outdir / f"{basename}.csv")
 
@@ -45,82 +75,132 @@ def _filter_recent_games(records: Iterable[Dict[str, str]], weeks: int) -> List[
 
     cutoff = datetime.now() - timedelta(weeks=weeks)
 
-    filtered: List[Dict[str, str]] = []
-    for record in records:
-        parsed = parse_game_date(record.get("date", ""))
-        if parsed is None or parsed >= cutoff:
-            filtered.append(record)
-    return filtered
+    return [
+        record
+        for record in records
+        if (parsed := parse_game_date(record.get("date", ""))) is None or parsed >= cutoff
+    ]
+
+
+def _run_fetchers(
+    fetchers: Dict[str, Callable[[], object]], max_workers: int
+) -> Tuple[Dict[str, object], Dict[str, BaseException]]:
+    """
+    Run every fetcher, returning the results that succeeded and the errors of those that failed.
+    """
+    results: Dict[str, object] = {}
+    errors: Dict[str, BaseException] = {}
+    if not fetchers:
+        return results, errors
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch): name for name, fetch in fetchers.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            error = future.exception()
+            if error is None:
+                results[name] = future.result()
+            else:
+                errors[name] = error
+    return results, errors
 
 
 def handle_scrape(args: argparse.Namespace) -> None:
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    scraper = _build_scraper(args.backend, args.team)
+    cache = None if args.no_cache else ResponseCache(outdir / ".cache", max_age=args.max_age)
+    scraper = _build_scraper(args.backend, args.team, cache=cache)
+    compress = args.zstd
 
+    # Targets are network bound and independent, so fetch them concurrently against the
+    # shared scraper and keep all file writes on this thread afterwards.
+    fetchers: Dict[str, Callable[[], object]] = {}
     if "schedule" in args.targets or args.recent_weeks is not None or args.current_week:
-        schedule = scraper.scrape_schedule()
-        _export_records(schedule, outdir, "schedule", emit_json=not args.no_json, emit_csv=not args.no_csv)
+        fetchers["schedule"] = scraper.scrape_schedule
+    if "stats" in args.targets:
+        fetchers["stats"] = lambda: scraper.scrape_stats(sort_by=args.sort_stats)
+    if "results" in args.targets:
+        fetchers["results"] = scraper.scrape_results
+    if "rosters" in args.targets:
+        fetchers["rosters"] = scraper.scrape_rosters
+    if "standings" in args.targets:
+        fetchers["standings"] = scraper.scrape_standings
+
+    # Each Playwright scrape launches its own browser; keep those sequential.
+    max_workers = len(fetchers) if args.backend == "http" else 1
+    fetched, errors = _run_fetchers(fetchers, max_workers=max(1, max_workers))
+
+    if "schedule" in fetched:
+        schedule = fetched["schedule"]
+        _export_records(schedule, outdir, "schedule", emit_json=not args.no_json, emit_csv=not args.no_csv, compress=compress)
 
         if args.recent_weeks is not None:
             recent = _filter_recent_games(schedule, args.recent_weeks)
             if not args.no_json:
-                export_json(recent, outdir / "recent_games.json")
+                export_json(recent, outdir / _json_name("recent_games", compress))
 
         if args.current_week:
             current = _filter_recent_games(schedule, weeks=0)
             if not args.no_json:
-                export_json(current, outdir / "current_week_games.json")
+                export_json(current, outdir / _json_name("current_week_games", compress))
 
-    if "stats" in args.targets:
-        stats = scraper.scrape_stats(sort_by=args.sort_stats)
-        _export_records(stats, outdir, "player_stats", emit_json=not args.no_json, emit_csv=not args.no_csv)
+    if "stats" in fetched:
+        stats = fetched["stats"]
+        _export_records(stats, outdir, "player_stats", emit_json=not args.no_json, emit_csv=not args.no_csv, compress=compress)
 
-    if "results" in args.targets:
-        results = scraper.scrape_results()
+    if "results" in fetched:
+        results = fetched["results"]
         if not args.no_json:
-            export_json(results, outdir / "results.json")
+            export_json(results, outdir / _json_name("results", compress))
 
-    if "rosters" in args.targets:
-        rosters = scraper.scrape_rosters()
+    if "rosters" in fetched:
+        rosters = fetched["rosters"]
         if not args.no_json and rosters:
             roster_dir = outdir / "rosters"
             roster_dir.mkdir(parents=True, exist_ok=True)
-            export_json(list(rosters.values()), outdir / "rosters.json")
             players_flat: List[Dict[str, str]] = []
-            for slug, roster in rosters.items():
-                export_json(roster["players"], roster_dir / f"{slug}.json")
-                team_meta = {
-                    "team_id": roster.get("team_id"),
-                    "team_name": roster.get("team_name"),
-                    "team_slug": roster.get("team_slug", slug),
-                }
-                for player in roster.get("players", []):
-                    merged = dict(player)
-                    merged.update(team_meta)
-                    players_flat.append(merged)
-            export_json(players_flat, outdir / "players.json")
+
+            def _each_roster():
+                # Per-team files and the flat player list are produced while rosters.json
+                # streams, so every roster is visited once.
+                for slug, roster in rosters.items():
+                    export_json(roster["players"], roster_dir / _json_name(slug, compress))
+                    team_meta = {
+                        "team_id": roster.get("team_id"),
+                        "team_name": roster.get("team_name"),
+                        "team_slug": roster.get("team_slug", slug),
+                    }
+                    for player in roster.get("players", []):
+                        merged = dict(player)
+                        merged.update(team_meta)
+                        players_flat.append(merged)
+                    yield roster
+
+            export_json_stream(_each_roster(), outdir / _json_name("rosters", compress))
+            export_json(players_flat, outdir / _json_name("players", compress))
 
     if "teams" in args.targets:
         if not args.no_json:
-            teams_path = resources.files("aahlscraper.data").joinpath("teams.json")
-            data = teams_path.read_text(encoding="utf-8")
-            target = outdir / "teams.json"
-            target.write_text(data, encoding="utf-8")
+            with resources.as_file(_teams_resource()) as teams_path:
+                shutil.copyfile(teams_path, outdir / "teams.json")
 
-    if "standings" in args.targets:
-        standings = scraper.scrape_standings()
-        _export_records(standings, outdir, "standings", emit_json=not args.no_json, emit_csv=not args.no_csv)
+    if "standings" in fetched:
+        standings = fetched["standings"]
+        _export_records(standings, outdir, "standings", emit_json=not args.no_json, emit_csv=not args.no_csv, compress=compress)
+
+    # Targets that succeeded are written above; surface the first failure afterwards.
+    if errors:
+        for name, error in errors.items():
+            print(f"Failed to scrape {name}: {error}", file=sys.stderr)
+        raise next(iter(errors.values()))
 
 
 def handle_diagnostics(args: argparse.Namespace) -> None:
-    results = run_diagnostics(team_id=args.team)
+    cache_path = None if args.no_cache else Path(args.cache)
+    results = run_diagnostics(team_id=args.team, session=_get_session(), cache_path=cache_path)
 
     if args.output:
-        path = Path(args.output)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        write_json(results, Path(args.output))
 
     print(f"Diagnostics for team {args.team}")
     for label, result in results.items():
@@ -149,6 +229,11 @@ def build_parser() -> argparse.ArgumentParser:
     scrape_parser.add_argument("--outdir", default="data", help="Directory where output files will be written")
     scrape_parser.add_argument("--no-json", action="store_true", help="Skip writing JSON output files")
     scrape_parser.add_argument("--no-csv", action="store_true", help="Skip writing CSV output files")
+    scrape_parser.add_argument(
+        "--zstd",
+        action="store_true",
+        help="Write JSON outputs zstd-compressed (*.json.zst); requires the zstandard package",
+    )
     scrape_parser.add_argument(
         "--targets",
         nargs="+",
@@ -156,6 +241,13 @@ def build_parser() -> argparse.ArgumentParser:
         default=("schedule", "results", "stats", "standings"),
         help="Data sets to scrape (default: all)",
     )
+    scrape_parser.add_argument(
+        "--max-age",
+        type=float,
+        default=300,
+        help="Reuse cached page responses younger than this many seconds (HTTP backend, default: 300)",
+    )
+    scrape_parser.add_argument("--no-cache", action="store_true", help="Ignore cached page responses and refetch everything")
     scrape_parser.add_argument("--sort-stats", default="points", help="Sort order for stats endpoint")
     scrape_parser.add_argument("--recent-weeks", type=int, help="Also emit recent_games.json filtered by trailing weeks")
     scrape_parser.add_argument("--current-week", action="store_true", help="Also emit current_week_games.json")
@@ -163,6 +255,12 @@ def build_parser() -> argparse.ArgumentParser:
 
     diag_parser = subparsers.add_parser("diagnostics", help="Run diagnostics to determine best scraping strategy")
     diag_parser.add_argument("--output", help="Optional path to write diagnostic results as JSON")
+    diag_parser.add_argument(
+        "--cache",
+        default="data/.diag_cache.json",
+        help="File recording page validators and results for conditional re-checks (default: data/.diag_cache.json)",
+    )
+    diag_parser.add_argument("--no-cache", action="store_true", help="Ignore cached page results and re-analyze every page")
     diag_parser.set_defaults(func=handle_diagnostics)
 
     return parser
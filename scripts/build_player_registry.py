@@ -5,13 +5,22 @@ Generate a canonical player registry with persistent IDs and attendance metrics.
 
 from __future__ import annotations
 
-import importlib.util
+import heapq
 import json
 import sys
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = PROJECT_ROOT / "data"
@@ -22,17 +31,8 @@ SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-UTILS_PATH = SRC_DIR / "aahlscraper" / "utils.py"
-spec = importlib.util.spec_from_file_location("aahlscraper_utils", UTILS_PATH)
-if spec is None or spec.loader is None:
-    raise ImportError(f"Unable to load utilities module from {UTILS_PATH}")
-_utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(_utils)
-
-derive_player_id = getattr(_utils, "derive_player_id")
-normalize_player_key = getattr(_utils, "normalize_player_key")
-player_name_variants = getattr(_utils, "player_name_variants")
-slugify = getattr(_utils, "slugify")
+from aahlscraper.exporters import write_json
+from aahlscraper.utils import derive_player_id, player_name_variants, slugify
 
 
 def _load_json(path: Path) -> Optional[object]:
@@ -45,11 +45,12 @@ def _load_json(path: Path) -> Optional[object]:
 def _latest_history(folder: Path) -> Tuple[Optional[Path], Optional[Path]]:
     if not folder.exists():
         return None, None
-    files = sorted(folder.glob("*.json"))
-    if not files:
+    # Snapshot names are timestamp-sortable, so only the two newest need ordering.
+    newest = heapq.nlargest(2, folder.glob("*.json"))
+    if not newest:
         return None, None
-    latest = files[-1]
-    previous = files[-2] if len(files) >= 2 else None
+    latest = newest[0]
+    previous = newest[1] if len(newest) >= 2 else None
     return latest, previous
 
 
@@ -87,8 +88,14 @@ def _to_float(value: object, default: float = 0.0) -> float:
     return default
 
 
-def _build_roster_lookup(rosters: Iterable[Dict[str, object]]) -> Tuple[Dict[Tuple[str, str], Dict[str, object]], Dict[str, Dict[str, object]]]:
+def _build_roster_lookup(
+    rosters: Iterable[Dict[str, object]],
+) -> Tuple[Dict[Tuple[str, str], Dict[str, object]], Dict[str, Dict[str, object]], Dict[str, Dict[str, object]]]:
+    """
+    Index roster players by (team_slug, name variant) and by player_id, plus team metadata.
+    """
     lookup: Dict[Tuple[str, str], Dict[str, object]] = {}
+    id_lookup: Dict[str, Dict[str, object]] = {}
     teams: Dict[str, Dict[str, object]] = {}
     for roster in rosters:
         team_slug = roster.get("team_slug")
@@ -116,31 +123,44 @@ def _build_roster_lookup(rosters: Iterable[Dict[str, object]]) -> Tuple[Dict[Tup
                 "team_slug": team_slug,
                 "meta": player,
             }
+            # The first roster entry claiming a variant keeps it.
             for key in player_name_variants(str(name)):
                 lookup.setdefault((team_slug, key), payload)
-    return lookup, teams
-
-
-def _team_games_played(results: Iterable[Dict[str, object]]) -> Dict[str, int]:
-    counts: Dict[str, int] = defaultdict(int)
-    for game in results:
-        if not isinstance(game, dict):
-            continue
-        status = str(game.get("status", "")).lower()
-        if status and status not in ("final", "completed"):
-            continue
-        for side_key in ("home_line", "away_line"):
-            side = game.get(side_key)
-            slug = None
-            if isinstance(side, dict):
-                slug = side.get("slug")
-            if not slug:
-                team_name = game.get("home") if side_key == "home_line" else game.get("away")
-                if isinstance(team_name, str):
-                    slug = slugify(team_name)
-            if slug:
-                counts[slug] += 1
-    return counts
+            id_lookup[player_id] = payload
+    return lookup, id_lookup, teams
+
+
+_DONE_STATUSES = frozenset(("", "final", "completed"))
+
+
+def _completed_team_slugs(game: Dict[str, object]) -> Iterator[str]:
+    """Yield the team slugs that should be credited a game played for a completed result."""
+    if str(game.get("status", "")).lower() not in _DONE_STATUSES:
+        return
+    for side_key, name_key in (("home_line", "home"), ("away_line", "away")):
+        side = game.get(side_key)
+        slug = side.get("slug") if isinstance(side, dict) else None
+        if not slug:
+            team_name = game.get(name_key)
+            if isinstance(team_name, str):
+                slug = slugify(team_name)
+        if slug:
+            yield slug
+
+
+def _iter_results(path: Path) -> Iterator[object]:
+    """
+    Yield the games in results.json one at a time, streaming with ijson when it is installed.
+    """
+    if ijson is None:
+        data = _load_json(path)
+        if isinstance(data, list):
+            yield from data
+        return
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        yield from ijson.items(handle, "item", use_float=True)
 
 
 def _load_previous_registry() -> Dict[str, Dict[str, object]]:
@@ -165,50 +185,78 @@ def _load_previous_registry() -> Dict[str, Dict[str, object]]:
     return mapping
 
 
-def _lookup_previous(previous: Dict[str, Dict[str, object]], team_slug: str, player_id: str, name: str) -> Optional[Dict[str, object]]:
-    if not previous:
-        return None
-    if player_id and str(player_id) in previous:
-        return previous[str(player_id)]
-    key = str((team_slug, normalize_player_key(name)))
-    return previous.get(key)
+_SEASON_STAT_COLUMNS = {
+    "gp": "games_played",
+    "g": "goals",
+    "a": "assists",
+    "pts": "points",
+    "pim": "penalty_minutes",
+}
 
 
 def _build_player_stats_lookup(player_stats: List[Dict[str, object]]) -> Dict[str, Dict[str, object]]:
     """Build lookup from player_stats.json (authoritative season stats from AAHL website)."""
+    rows = [stat for stat in player_stats if isinstance(stat, dict) and stat.get("player_id")]
+    if not rows:
+        return {}
+
+    # Coerce every counting column in one vectorized pass; blanks and junk become 0 like _to_int.
+    columns = list(_SEASON_STAT_COLUMNS)
+    frame = pd.DataFrame(rows).reindex(columns=columns)
+    counts = frame.apply(pd.to_numeric, errors="coerce").fillna(0).astype("int64").to_numpy().tolist()
+
     lookup: Dict[str, Dict[str, object]] = {}
-    for stat in player_stats:
-        if not isinstance(stat, dict):
-            continue
-        player_id = stat.get("player_id")
-        if player_id:
-            lookup[str(player_id)] = {
-                "games_played": _to_int(stat.get("gp")),
-                "goals": _to_int(stat.get("g")),
-                "assists": _to_int(stat.get("a")),
-                "points": _to_int(stat.get("pts")),
-                "penalty_minutes": _to_int(stat.get("pim")),
-                "positions": [stat.get("pos")] if stat.get("pos") else [],
-                "number": stat.get("no"),
-            }
+    for stat, values in zip(rows, counts):
+        entry: Dict[str, object] = dict(zip(_SEASON_STAT_COLUMNS.values(), values))
+        entry["positions"] = [stat.get("pos")] if stat.get("pos") else []
+        entry["number"] = stat.get("no")
+        lookup[str(stat["player_id"])] = entry
     return lookup
 
 
+def _apply_derived_stats(entries: List[Dict[str, object]], previous: Dict[str, Dict[str, object]]) -> None:
+    """Fill points_per_game and the recent_* deltas against the previous registry in one vectorized pass."""
+    if not entries:
+        return
+    previous_rows = [previous.get(str(entry["player_id"])) or {} for entry in entries]
+    frame = pd.DataFrame(
+        {
+            "gp": [entry.get("games_played", 0) for entry in entries],
+            "points": [entry.get("points", 0) for entry in entries],
+            "prev_gp": [_to_int(row.get("games_played")) for row in previous_rows],
+            "prev_points": [_to_int(row.get("points")) for row in previous_rows],
+        }
+    )
+    # Python's round() is kept for the final step; numpy's half-even scaling disagrees on values like 0.025.
+    ppg = (frame["points"] / frame["gp"].where(frame["gp"] > 0)).fillna(0.0).map(lambda value: round(value, 2))
+    recent_points = (frame["points"] - frame["prev_points"]).tolist()
+    recent_games = (frame["gp"] - frame["prev_gp"]).tolist()
+
+    for entry, per_game, points_delta, games_delta in zip(entries, ppg.tolist(), recent_points, recent_games):
+        entry["points_per_game"] = per_game
+        entry["recent_points"] = points_delta
+        entry["recent_games"] = games_delta
+
+
 def build_registry() -> List[Dict[str, object]]:
-    rosters_data = _load_json(DATA_DIR / "rosters.json") or []
-    results_data = _load_json(DATA_DIR / "results.json") or []
-    player_stats_data = _load_json(DATA_DIR / "player_stats.json") or []
+    # The small inputs are independent files, so read and parse them concurrently;
+    # results.json is streamed below in a single pass.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        rosters_future = executor.submit(_load_json, DATA_DIR / "rosters.json")
+        player_stats_future = executor.submit(_load_json, DATA_DIR / "player_stats.json")
+        previous_future = executor.submit(_load_previous_registry)
+        rosters_data = rosters_future.result() or []
+        player_stats_data = player_stats_future.result() or []
+        previous_registry = previous_future.result()
 
     if not isinstance(rosters_data, list):
         rosters_data = []
-    if not isinstance(results_data, list):
-        results_data = []
     if not isinstance(player_stats_data, list):
         player_stats_data = []
 
-    roster_lookup, team_meta = _build_roster_lookup(rosters_data)
-    team_games = _team_games_played(results_data)
-    previous_registry = _load_previous_registry()
+    roster_lookup, roster_by_id, team_meta = _build_roster_lookup(rosters_data)
+    # Filled while streaming results; team_games_played is assigned from it after the pass.
+    team_games: Counter[str] = Counter()
 
     # Load authoritative season stats from player_stats.json (scraped from AAHL website)
     player_stats_lookup = _build_player_stats_lookup(player_stats_data)
@@ -233,15 +281,16 @@ def build_registry() -> List[Dict[str, object]]:
             "points": 0,
             "penalty_minutes": 0,
             "points_per_game": 0.0,
-            "team_games_played": team_games.get(team_slug, 0),
+            "team_games_played": 0,
             "games_missed": None,
             "recent_points": None,
             "recent_games": None,
         }
 
-    for game in results_data:
+    for game in _iter_results(DATA_DIR / "results.json"):
         if not isinstance(game, dict):
             continue
+        team_games.update(_completed_team_slugs(game))
         player_stats = game.get("player_stats") or {}
         if not player_stats:
             continue
@@ -265,14 +314,17 @@ def build_registry() -> List[Dict[str, object]]:
                 name = stat.get("name") or ""
                 player_id = stat.get("player_id")
                 number = stat.get("number")
-                if not player_id and team_slug:
+                # Exact id match first; the name-variant scan only runs for rows without an id.
+                hit = roster_by_id.get(player_id) if player_id else None
+                if hit is None and not player_id and team_slug:
                     for key in player_name_variants(name):
                         hit = roster_lookup.get((team_slug, key))
                         if hit:
-                            player_id = hit["player_id"]
-                            if not number:
-                                number = hit.get("number")
                             break
+                if hit:
+                    player_id = hit["player_id"]
+                    if not number:
+                        number = hit.get("number")
                 if not player_id and team_slug:
                     player_id = derive_player_id(team_slug, name, number)
 
@@ -292,7 +344,7 @@ def build_registry() -> List[Dict[str, object]]:
                         "points": 0,
                         "penalty_minutes": 0,
                         "points_per_game": 0.0,
-                        "team_games_played": team_games.get(team_slug, 0),
+                        "team_games_played": 0,
                         "games_missed": None,
                         "recent_points": None,
                         "recent_games": None,
@@ -334,30 +386,21 @@ def build_registry() -> List[Dict[str, object]]:
             if authoritative.get("number") and not entry.get("number"):
                 entry["number"] = authoritative["number"]
 
-        gp = entry.get("games_played", 0)
-        points = entry.get("points", 0)
-        entry["points_per_game"] = round(points / gp, 2) if gp else 0.0
-
-        prev = previous_registry.get(str(entry["player_id"]))
-        if prev:
-            prev_points = _to_int(prev.get("points"))
-            prev_gp = _to_int(prev.get("games_played"))
-            entry["recent_points"] = points - prev_points
-            entry["recent_games"] = gp - prev_gp
-        else:
-            entry["recent_points"] = points
-            entry["recent_games"] = gp
+    _apply_derived_stats(list(registry.values()), previous_registry)
 
-    registry_list = list(registry.values())
-    registry_list.sort(key=lambda item: (item.get("team_slug") or "", (item.get("number") or ""), item.get("name") or ""))
-    return registry_list
+    # Decorate once so the sort compares precomputed tuples instead of calling a lambda per item.
+    keyed = [
+        ((entry.get("team_slug") or "", entry.get("number") or "", entry.get("name") or ""), entry)
+        for entry in registry.values()
+    ]
+    keyed.sort(key=itemgetter(0))
+    return [entry for _, entry in keyed]
 
 
 def main() -> None:
     registry = build_registry()
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(timezone.utc).isoformat()
-    OUTPUT_PATH.write_text(json.dumps({"generated_at": timestamp, "players": registry}, indent=2), encoding="utf-8")
+    write_json({"generated_at": timestamp, "players": registry}, OUTPUT_PATH)
 
 
 if __name__ == "__main__":
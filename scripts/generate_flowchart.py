@@ -1,9 +1,18 @@
+import hashlib
+import sys
 from pathlib import Path
 
 import plotly.graph_objects as go
 
-# Create a comprehensive flowchart using Plotly
-fig = go.Figure()
+try:
+    import cairosvg
+except ImportError:
+    cairosvg = None
+
+# Shapes and annotations are collected as plain dicts and handed to the figure in one go,
+# avoiding a validation pass per add_shape/add_annotation call.
+shapes = []
+annotations = []
 
 # Define positions for flowchart elements
 positions = {
@@ -37,15 +46,15 @@ rectangles = [
 
 for key, text, color in rectangles:
     x, y = positions[key]
-    fig.add_shape(
+    shapes.append(dict(
         type="rect",
         x0=x-1, y0=y-0.4, x1=x+1, y1=y+0.4,
         fillcolor=color,
         opacity=0.7,
         line=dict(color="black", width=2)
-    )
+    ))
     
-    fig.add_annotation(
+    annotations.append(dict(
         x=x, y=y,
         text=text,
         showarrow=False,
@@ -53,25 +62,25 @@ for key, text, color in rectangles:
         bgcolor="rgba(255,255,255,0.8)",
         bordercolor="black",
         borderwidth=1
-    )
+    ))
 
 # Add diamond for decision
 x, y = positions['decision']
-fig.add_shape(
+shapes.append(dict(
     type="path",
     path=f"M {x-1.2},{y} L {x},{y+0.6} L {x+1.2},{y} L {x},{y-0.6} Z",
     fillcolor=colors[1],
     opacity=0.7,
     line=dict(color="black", width=2)
-)
+))
 
-fig.add_annotation(
+annotations.append(dict(
     x=x, y=y,
     text="Is data in<br>HTML source?",
     showarrow=False,
     font=dict(size=10, color="black"),
     bgcolor="rgba(255,255,255,0.8)"
-)
+))
 
 # Add arrows and connections
 arrows = [
@@ -109,7 +118,7 @@ for (x1, y1), (x2, y2) in arrows:
             x1 -= 1
             x2 += 1
     
-    fig.add_annotation(
+    annotations.append(dict(
         x=x2, y=y2,
         ax=x1, ay=y1,
         xref='x', yref='y',
@@ -119,26 +128,47 @@ for (x1, y1), (x2, y2) in arrows:
         arrowwidth=2,
         arrowcolor="black",
         showarrow=True
-    )
+    ))
 
 # Add YES/NO labels for decision branches
-fig.add_annotation(x=-1.2, y=6.8, text="YES", showarrow=False, font=dict(size=12, color="green"))
-fig.add_annotation(x=1.2, y=6.8, text="NO", showarrow=False, font=dict(size=12, color="red"))
+annotations.append(dict(x=-1.2, y=6.8, text="YES", showarrow=False, font=dict(size=12, color="green")))
+annotations.append(dict(x=1.2, y=6.8, text="NO", showarrow=False, font=dict(size=12, color="red")))
 
-# Configure layout
-fig.update_layout(
+# Build the figure with its full layout in a single pass
+fig = go.Figure(layout=dict(
+    shapes=shapes,
+    annotations=annotations,
     title="Amherst Hockey Scraping Decision Process",
     xaxis=dict(range=[-4, 4], showgrid=False, zeroline=False, showticklabels=False),
     yaxis=dict(range=[-3, 10], showgrid=False, zeroline=False, showticklabels=False),
     plot_bgcolor='white',
     showlegend=False,
     font=dict(family="Arial", size=12)
-)
+))
 
 # Save the flowchart
 output_dir = Path("docs")
 output_dir.mkdir(parents=True, exist_ok=True)
-fig.write_image(str(output_dir / "flowchart.png"))
-fig.write_image(str(output_dir / "flowchart.svg"), format='svg')
+
+# Skip the (slow) Kaleido export when the figure spec matches the last render.
+hash_path = output_dir / "flowchart.hash"
+spec_hash = hashlib.blake2b(fig.to_json().encode("utf-8"), digest_size=16).hexdigest()
+outputs = (output_dir / "flowchart.png", output_dir / "flowchart.svg")
+if (
+    hash_path.exists()
+    and hash_path.read_text(encoding="utf-8").strip() == spec_hash
+    and all(path.exists() for path in outputs)
+):
+    print("Flowchart unchanged; skipping render.")
+    sys.exit(0)
+
+# Render through Kaleido once as SVG and rasterize that locally when cairosvg is available.
+svg_bytes = fig.to_image(format='svg')
+(output_dir / "flowchart.svg").write_bytes(svg_bytes)
+if cairosvg is not None:
+    cairosvg.svg2png(bytestring=svg_bytes, write_to=str(output_dir / "flowchart.png"))
+else:
+    fig.write_image(str(output_dir / "flowchart.png"))
+hash_path.write_text(spec_hash + "\n", encoding="utf-8")
 
 print("Professional flowchart created successfully!")
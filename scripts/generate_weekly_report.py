@@ -5,17 +5,45 @@ Generate a lightweight weekly report with standings movement and simple headline
 
 from __future__ import annotations
 
+import heapq
 import json
-from collections import defaultdict
+import os
+import sys
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = PROJECT_ROOT / "data"
 HISTORY_DIR = DATA_DIR / "history"
 REPORT_PATH = DATA_DIR / "weekly_report.json"
 HEADLINES_PATH = DATA_DIR / "headlines.json"
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from aahlscraper.exporters import json_bytes
+
+# Sort key for games without a parseable datetime.
+_DT_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
+# datetime.fromisoformat only understands a trailing "Z" from Python 3.11 on.
+_FROMISOFORMAT_NEEDS_OFFSET = sys.version_info < (3, 11)
+# Parsed game datetimes by raw string; games in a slot share a start time and each report
+# loads results twice, so most lookups repeat.
+_DT_CACHE: Dict[str, Optional[datetime]] = {}
+_DT_CACHE_MAX = 4096
+# Only games this recent get an AI narrative; older games keep whatever they already have.
+RECENT_NARRATIVE_DAYS = 7
 
 try:
     from build_player_registry import main as build_player_registry_main
@@ -23,46 +51,125 @@ except ImportError:
     build_player_registry_main = None
 
 try:
-    from openai_headlines import generate_ai_headline, enrich_games_with_ai, generate_rich_narrative
+    from openai_headlines import (
+        compact_cache,
+        enrich_games_with_ai,
+        generate_ai_headline,
+        generate_rich_narrative,
+        index_standings,
+        rank_standings,
+    )
     OPENAI_HEADLINES_AVAILABLE = True
 except ImportError:
     OPENAI_HEADLINES_AVAILABLE = False
     generate_ai_headline = None
     enrich_games_with_ai = None
     generate_rich_narrative = None
+    index_standings = None
+    compact_cache = None
+    rank_standings = None
 
 def _load_json(path: Path) -> Optional[object]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return None
+    # Callers treat the result as read-only, so repeat loads in one run can share it.
+    return _load_json_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Optional[object]:
+    # mtime and size are part of the cache key, so a rewritten file is parsed again.
+    path = Path(path_str)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
+def _dump_json(payload: object, path: Path) -> None:
+    # Write beside the target and swap it in, so an interrupted run never leaves a torn file.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(json_bytes(payload))
+    os.replace(tmp_path, path)
+
+
 def _latest_history(folder: Path) -> Tuple[Optional[Path], Optional[Path]]:
     if not folder.exists():
         return None, None
 
-    files = sorted(folder.glob("*.json"))
-    if not files:
+    with os.scandir(folder) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith(".json") and not entry.name.startswith(".")]
+    newest = heapq.nlargest(2, names)
+    if not newest:
         return None, None
-    latest = files[-1]
-    previous = files[-2] if len(files) >= 2 else None
+    latest = folder / newest[0]
+    previous = folder / newest[1] if len(newest) >= 2 else None
     return latest, previous
 
 
 def _parse_game_datetime(value: object) -> Optional[datetime]:
     if not value:
         return None
+    raw = value if isinstance(value, str) else str(value)
+    try:
+        return _DT_CACHE[raw]
+    except KeyError:
+        pass
+    text = raw
+    if _FROMISOFORMAT_NEEDS_OFFSET and text.endswith("Z"):
+        text = text[:-1] + "+00:00"
     try:
-        dt = datetime.fromisoformat(str(value))
+        dt = datetime.fromisoformat(text)
     except ValueError:
+        dt = None
+    else:
+        dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+    if len(_DT_CACHE) >= _DT_CACHE_MAX:
+        _DT_CACHE.clear()
+    _DT_CACHE[raw] = dt
+    return dt
+
+
+def _game_dt(game: Dict[str, object]) -> Optional[datetime]:
+    """Return the datetime parsed by _load_recent_results, parsing only if it was not stashed."""
+    if "_dt" in game:
+        return game["_dt"]
+    return _parse_game_datetime(game.get("datetime"))
+
+
+def _int_from_str(value: str) -> Optional[int]:
+    text = value.strip()
+    if not text:
         return None
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return int(float(text))
+        except (ValueError, TypeError):
+            return None
+
+
+def _int_identity(value: int) -> int:
+    return value
+
+
+# Exact-type dispatch for _safe_int; bool must map to int() rather than the identity.
+_INT_COERCERS = {
+    int: _int_identity,
+    str: _int_from_str,
+    float: int,
+    bool: int,
+}
 
 
 def _safe_int(value: object) -> Optional[int]:
+    coerce = _INT_COERCERS.get(type(value))
+    if coerce is not None:
+        return coerce(value)
+    # Subclasses (e.g. IntEnum members) miss the exact-type table and take the isinstance path.
     if isinstance(value, bool):
         return int(value)
     if isinstance(value, int):
@@ -70,16 +177,7 @@ def _safe_int(value: object) -> Optional[int]:
     if isinstance(value, float):
         return int(value)
     if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return None
-        try:
-            return int(text)
-        except ValueError:
-            try:
-                return int(float(text))
-            except (ValueError, TypeError):
-                return None
+        return _int_from_str(value)
     return None
 
 
@@ -154,20 +252,29 @@ def _player_statline(player: Dict[str, object]) -> Optional[tuple[str, str]]:
     return _display_name(str(player.get("name", "Unknown"))), stat_text
 
 
-def _pick_phrase(options: List[str], seed: int) -> str:
+def _pick_phrase(options: Sequence[str], seed: int) -> str:
     if not options:
         return ""
     index = seed % len(options)
     return options[index]
 
 
+def _name_seed(value: str) -> int:
+    return zlib.crc32(value.encode("utf-8"))
+
+
 def _headline_seed(game_id: str) -> int:
     if not game_id:
         return 0
     try:
         return int(game_id) % 97
     except ValueError:
-        return sum(ord(ch) for ch in game_id)
+        return _name_seed(game_id)
+
+
+_PRIMARY_LEADS = ("sparked by", "powered by", "fueled by", "driven by", "lifted by")
+_SECONDARY_LEADS = ("while", "as", "with", "and")
+_SECONDARY_VERBS = ("adding", "chipping in", "contributing", "supplying")
 
 
 def _player_highlight_phrase(game: Dict[str, object], winner_side: str) -> Optional[str]:
@@ -199,15 +306,8 @@ def _player_highlight_phrase(game: Dict[str, object], winner_side: str) -> Optio
     if not primary:
         return None
 
-    primary_seed = sum(ord(ch) for ch in primary[0])
-    primary_leads = [
-        "sparked by",
-        "powered by",
-        "fueled by",
-        "driven by",
-        "lifted by",
-    ]
-    phrase = f"{_pick_phrase(primary_leads, primary_seed)} {primary[0]}'s {primary[1]}"
+    primary_seed = _name_seed(primary[0])
+    phrase = f"{_pick_phrase(_PRIMARY_LEADS, primary_seed)} {primary[0]}'s {primary[1]}"
 
     secondary = None
     for _, _, _, candidate in enriched[1:]:
@@ -217,56 +317,49 @@ def _player_highlight_phrase(game: Dict[str, object], winner_side: str) -> Optio
             break
 
     if secondary:
-        secondary_seed = sum(ord(ch) for ch in secondary[0])
-        secondary_leads = [
-            "while",
-            "as",
-            "with",
-            "and",
-        ]
-        secondary_verbs = [
-            "adding",
-            "chipping in",
-            "contributing",
-            "supplying",
-        ]
+        secondary_seed = _name_seed(secondary[0])
         phrase += (
-            f", {_pick_phrase(secondary_leads, secondary_seed)} {secondary[0]}"
-            f" {_pick_phrase(secondary_verbs, secondary_seed + primary_seed)} {secondary[1]}"
+            f", {_pick_phrase(_SECONDARY_LEADS, secondary_seed)} {secondary[0]}"
+            f" {_pick_phrase(_SECONDARY_VERBS, secondary_seed + primary_seed)} {secondary[1]}"
         )
 
     return phrase
 
 
-def _result_verb(margin: int, winner_score: int, loser_score: int, game_id: str) -> str:
-    blowout = ["obliterates", "thrashes", "trounces", "routs"]
-    big_win = ["steamrolls", "dominates", "dismantles", "pummels"]
-    comfortable = ["crushes", "cruises past", "handles", "dispatches"]
-    moderate = ["tops", "outduels", "overcomes", "best"]
-    tight = ["edges", "nips", "squeaks by", "slips past"]
-    shootout = ["outguns", "outlasts", "surges past", "prevails over"]
+_MODERATE = ("tops", "outduels", "overcomes", "best")
+_TIGHT = ("edges", "nips", "squeaks by", "slips past")
+_COMFORTABLE = ("crushes", "cruises past", "handles", "dispatches")
+_BIG_WIN = ("steamrolls", "dominates", "dismantles", "pummels")
+_BLOWOUT = ("obliterates", "thrashes", "trounces", "routs")
+_SHOOTOUT = ("outguns", "outlasts", "surges past", "prevails over")
+_TIE_PHRASES = ("battle to a draw with", "skate to a draw with", "finish deadlocked with", "settle for a tie with")
 
-    seed = _headline_seed(game_id)
+# Result verbs by margin tier; see _margin_tier.
+_RESULT_VERB_TIERS = (_MODERATE, _TIGHT, _MODERATE, _COMFORTABLE, _BIG_WIN, _BLOWOUT, _SHOOTOUT)
 
+
+def _margin_tier(margin: int, winner_score: int) -> int:
     if margin >= 6:
-        return _pick_phrase(blowout, seed)
+        return 5
     if margin >= 4:
-        return _pick_phrase(big_win, seed)
-    if margin == 3:
-        return _pick_phrase(comfortable, seed)
-    if margin == 2:
-        return _pick_phrase(moderate, seed)
-    if margin == 1:
-        return _pick_phrase(tight, seed)
-    return _pick_phrase(shootout if winner_score >= 6 else moderate, seed)
-
-
-def _compose_headline(game: Dict[str, object]) -> Optional[str]:
-    home = _team_name(game, "home")
-    away = _team_name(game, "away")
-    home_score = _safe_int(game.get("home_score"))
-    away_score = _safe_int(game.get("away_score"))
-    game_id = str(game.get("game_id", ""))
+        return 4
+    if margin >= 1:
+        return margin
+    return 6 if winner_score >= 6 else 0
+
+
+def _result_verb(margin: int, winner_score: int, loser_score: int, game_id: str) -> str:
+    return _pick_phrase(_RESULT_VERB_TIERS[_margin_tier(margin, winner_score)], _headline_seed(game_id))
+
+
+def _compose_headline(
+    game: Dict[str, object],
+    home: Optional[str],
+    away: Optional[str],
+    home_score: Optional[int],
+    away_score: Optional[int],
+    game_id: str,
+) -> Optional[str]:
     if (
         home is None
         or away is None
@@ -276,13 +369,7 @@ def _compose_headline(game: Dict[str, object]) -> Optional[str]:
         return None
 
     if home_score == away_score:
-        tie_phrases = [
-            "battle to a draw with",
-            "skate to a draw with",
-            "finish deadlocked with",
-            "settle for a tie with",
-        ]
-        tone = _pick_phrase(tie_phrases, _headline_seed(game_id))
+        tone = _pick_phrase(_TIE_PHRASES, _headline_seed(game_id))
         return f"{home} {tone} {away} {home_score}-{away_score}"
 
     margin = abs(home_score - away_score)
@@ -306,42 +393,95 @@ def _compose_headline(game: Dict[str, object]) -> Optional[str]:
     return headline
 
 
+def _prefetch_ai_text(
+    games: List[Tuple[str, Dict[str, object]]],
+    existing: Dict[str, Dict[str, object]],
+    ai_headline,
+    narrate,
+    standings: Optional[List[Dict[str, object]]],
+    standings_by_team: Optional[Dict[str, Dict[str, object]]] = None,
+    now: Optional[datetime] = None,
+    rank_map: Optional[Dict[str, int]] = None,
+) -> Tuple[Dict[int, Optional[str]], Dict[int, Optional[str]]]:
+    """
+    Issue the AI headline and narrative requests for ``games`` concurrently.
+
+    Narratives are only requested for games within RECENT_NARRATIVE_DAYS of ``now`` that do not
+    already have one. Results are keyed by position in ``games``; failed calls are reported and
+    stored as None.
+    """
+    headlines: Dict[int, Optional[str]] = {}
+    narratives: Dict[int, Optional[str]] = {}
+    if ai_headline is None and narrate is None:
+        return headlines, narratives
+
+    narrative_cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=RECENT_NARRATIVE_DAYS)
+    workers = max(1, int(os.getenv("AI_WORKERS", "8")))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for index, (game_id_str, game) in enumerate(games):
+            if ai_headline is not None:
+                futures[executor.submit(ai_headline, game)] = (headlines, index, "AI headline generation", game_id_str)
+            if (
+                narrate is not None
+                and not existing.get(game_id_str, {}).get("narrative")
+                and (dt := _game_dt(game)) is not None
+                and dt >= narrative_cutoff
+            ):
+                future = executor.submit(
+                    narrate, game, standings=standings, standings_by_team=standings_by_team, rank_map=rank_map
+                )
+                futures[future] = (narratives, index, "Narrative generation", game_id_str)
+        for future, (bucket, index, label, game_id_str) in futures.items():
+            error = future.exception()
+            if error is not None:
+                print(f"{label} failed for game {game_id_str}: {error}")
+                bucket[index] = None
+            else:
+                bucket[index] = future.result()
+    return headlines, narratives
+
+
 def _ensure_headlines(
     games: List[Dict[str, object]],
     existing: Dict[str, Dict[str, object]],
-    standings: Optional[List[Dict[str, object]]] = None
+    standings: Optional[List[Dict[str, object]]] = None,
+    now: Optional[datetime] = None,
+    standings_by_team: Optional[Dict[str, Dict[str, object]]] = None,
+    rank_map: Optional[Dict[str, int]] = None,
 ) -> List[Dict[str, object]]:
-    now_iso = datetime.now(timezone.utc).isoformat()
+    now_iso = (now or datetime.now(timezone.utc)).isoformat()
     entries: List[Dict[str, object]] = []
+    # Resolve the optional AI hooks once rather than re-checking module state per game.
+    ai_headline = generate_ai_headline if OPENAI_HEADLINES_AVAILABLE else None
+    narrate = generate_rich_narrative if OPENAI_HEADLINES_AVAILABLE else None
+
+    # The OpenAI calls are network bound, so issue them all up front and merge below.
+    identified = [(str(game["game_id"]), game) for game in games if game.get("game_id")]
+    ai_headlines, narratives = _prefetch_ai_text(
+        identified, existing, ai_headline, narrate, standings, standings_by_team, now, rank_map
+    )
 
-    for game in games:
-        game_id = game.get("game_id")
-        if not game_id:
-            continue
-        game_id_str = str(game_id)
+    for index, (game_id_str, game) in enumerate(identified):
+        home = _team_name(game, "home")
+        away = _team_name(game, "away")
+        home_score = _safe_int(game.get("home_score"))
+        away_score = _safe_int(game.get("away_score"))
 
         # Try AI headline first, fall back to template
-        headline = None
-        ai_generated = False
-
-        if OPENAI_HEADLINES_AVAILABLE and generate_ai_headline:
-            try:
-                headline = generate_ai_headline(game)
-                if headline:
-                    ai_generated = True
-            except Exception as e:
-                print(f"AI headline generation failed for game {game_id}: {e}")
+        headline = ai_headlines.get(index)
+        ai_generated = bool(headline)
 
         if not headline:
-            headline = _compose_headline(game)
+            headline = _compose_headline(game, home, away, home_score, away_score, game_id_str)
 
         if not headline:
             continue
 
-        existing_entry = existing.get(game_id_str, {})
-        entry = dict(existing_entry)
+        # Entries from _load_headline_index are already private copies, so update them in place.
+        entry = existing.get(game_id_str)
 
-        dt = _parse_game_datetime(game.get("datetime"))
+        dt = _game_dt(game)
         iso_dt = dt.isoformat() if dt else None
 
         if not entry:
@@ -358,22 +498,17 @@ def _ensure_headlines(
                 entry["ai_generated"] = ai_generated
                 entry["updated_at"] = now_iso
 
-        # Generate rich narrative for recent games (last 5)
-        narrative = entry.get("narrative")
-        if not narrative and OPENAI_HEADLINES_AVAILABLE and generate_rich_narrative:
-            try:
-                narrative = generate_rich_narrative(game, standings=standings)
-                if narrative:
-                    entry["narrative"] = narrative
-                    entry["updated_at"] = now_iso
-            except Exception as e:
-                print(f"Narrative generation failed for game {game_id}: {e}")
+        if not entry.get("narrative"):
+            narrative = narratives.get(index)
+            if narrative:
+                entry["narrative"] = narrative
+                entry["updated_at"] = now_iso
 
         entry["game_datetime"] = iso_dt
-        entry["home_team"] = _team_name(game, "home")
-        entry["away_team"] = _team_name(game, "away")
-        entry["home_score"] = _safe_int(game.get("home_score"))
-        entry["away_score"] = _safe_int(game.get("away_score"))
+        entry["home_team"] = home
+        entry["away_team"] = away
+        entry["home_score"] = home_score
+        entry["away_score"] = away_score
         entry["summary_url"] = game.get("summary_url")
         entry["box_score_url"] = game.get("box_score_url")
         entries.append(entry)
@@ -385,7 +520,11 @@ def _ensure_headlines(
 def _standing_points(team: Dict[str, object]) -> int:
     for key in ("points", "Points", "pts"):
         value = team.get(key)
-        if value and str(value).isdigit():
+        # Exact int check keeps bools out, as str(True) never passed the digit test.
+        if type(value) is int:
+            if value > 0:
+                return value
+        elif isinstance(value, str) and value.isdecimal():
             return int(value)
     return 0
 
@@ -398,23 +537,26 @@ def _standing_name(team: Dict[str, object]) -> str:
     return "Unknown"
 
 
-def _load_standings_snapshot(path: Optional[Path]) -> Dict[str, Dict[str, object]]:
+def _index_standings(data: List[Dict[str, object]]) -> Dict[str, int]:
+    return {_standing_name(team): _standing_points(team) for team in data if isinstance(team, dict)}
+
+
+def _load_standings_snapshot(path: Optional[Path]) -> Dict[str, int]:
     if path is None:
         return {}
     data = _load_json(path)
     if not isinstance(data, list):
         return {}
-    return {_standing_name(team): team for team in data}
+    return _index_standings(data)
 
 
 def _compute_movements(
-    current: Dict[str, Dict[str, object]],
-    previous: Dict[str, Dict[str, object]],
+    current: Dict[str, int],
+    previous: Dict[str, int],
 ) -> List[Dict[str, object]]:
     movements: List[Dict[str, object]] = []
-    for team_name, team in current.items():
-        current_points = _standing_points(team)
-        previous_points = _standing_points(previous.get(team_name, {}))
+    for team_name, current_points in current.items():
+        previous_points = previous.get(team_name, 0)
         delta = current_points - previous_points
         movements.append(
             {
@@ -429,14 +571,36 @@ def _compute_movements(
     return movements
 
 
-def _load_recent_results(days: Optional[int] = 7) -> List[Dict[str, object]]:
-    results = _load_json(DATA_DIR / "results.json")
+def _mentions_recent_date(path: Path, days: int, now: datetime) -> bool:
+    """
+    Cheap byte scan for any quoted ISO date in the window before paying for a full parse.
+
+    The window is padded by a day on each side because game datetimes are stored in local time.
+    """
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return False
+    today = now.date()
+    prefixes = {
+        (today - timedelta(days=offset)).strftime('"%Y-%m-%d').encode("ascii")
+        for offset in range(-1, days + 2)
+    }
+    return any(prefix in raw for prefix in prefixes)
+
+
+def _load_recent_results(days: Optional[int] = 7, now: Optional[datetime] = None) -> List[Dict[str, object]]:
+    now = now or datetime.now(timezone.utc)
+    results_path = DATA_DIR / "results.json"
+    if days is not None and not _mentions_recent_date(results_path, days, now):
+        return []
+    results = _load_json(results_path)
     if not isinstance(results, list):
         return []
 
     cutoff = None
     if days is not None:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = now - timedelta(days=days)
     recent: List[Dict[str, object]] = []
     for game in results:
         if str(game.get("status", "")).lower() != "final":
@@ -445,24 +609,23 @@ def _load_recent_results(days: Optional[int] = 7) -> List[Dict[str, object]]:
         if cutoff is not None and (not dt or dt < cutoff):
             continue
         game_copy = dict(game)
-        if dt:
-            game_copy["_dt"] = dt
+        # Keep the parsed value on the copy so later sorts and headline entries reuse it.
+        game_copy["_dt"] = dt
         recent.append(game_copy)
 
     recent.sort(
-        key=lambda item: item.get("_dt") or datetime.min.replace(tzinfo=timezone.utc),
+        key=lambda item: item["_dt"] or _DT_MIN_UTC,
         reverse=True,
     )
-    for game in recent:
-        game.pop("_dt", None)
     return recent
 
 
 def _game_key(game: Dict[str, object]) -> tuple[str, str, str]:
     home_line = game.get("home_line") or {}
     away_line = game.get("away_line") or {}
-    home_slug = str(home_line.get("slug") or game.get("home", "")).strip().lower()
-    away_slug = str(away_line.get("slug") or game.get("away", "")).strip().lower()
+    # Slugs repeat across nearly every game, so intern them; datetimes are too varied to bother.
+    home_slug = sys.intern(str(home_line.get("slug") or game.get("home", "")).strip().lower())
+    away_slug = sys.intern(str(away_line.get("slug") or game.get("away", "")).strip().lower())
     dt = str(
         game.get("datetime")
         or game.get("start_local")
@@ -483,80 +646,72 @@ def _total_player_stats(game: Dict[str, object]) -> int:
     return total
 
 
-def _unique_games(games: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    best_by_key: Dict[tuple[str, str, str], Dict[str, object]] = {}
-    winner_counts: Dict[tuple[str, str, str], int] = {}
+def _dedup_and_sort(games: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """
+    Keep the most complete copy of each game and return them newest first.
+
+    Each retained game carries its datetime and its (player stats, scoreboard rows, winner
+    stat rows) score, so a duplicate needs one tuple comparison and the final sort no
+    datetime lookups; earlier games win ties.
+    """
+    best_by_key: Dict[tuple[str, str, str], tuple[datetime, tuple[int, int, int], Dict[str, object]]] = {}
     for game in games:
         key = _game_key(game)
-        total_stats = _total_player_stats(game)
-        scoreboard_len = len(game.get("scoreboard") or [])
         winner_side = "home" if (_safe_int(game.get("home_score")) or 0) >= (_safe_int(game.get("away_score")) or 0) else "away"
         stats = game.get("player_stats") or {}
         winner_stat_count = len(stats.get(winner_side, [])) if isinstance(stats.get(winner_side), list) else 0
+        score = (_total_player_stats(game), len(game.get("scoreboard") or []), winner_stat_count)
         existing = best_by_key.get(key)
-        if existing is None:
-            best_by_key[key] = game
-            winner_counts[key] = winner_stat_count
-            continue
+        if existing is None or score > existing[1]:
+            dt = _game_dt(game) or _DT_MIN_UTC
+            best_by_key[key] = (dt, score, game)
 
-        existing_stats = _total_player_stats(existing)
-        existing_scoreboard = len(existing.get("scoreboard") or [])
-        existing_winner_stat = winner_counts.get(key, 0)
-
-        if total_stats > existing_stats:
-            best_by_key[key] = game
-            winner_counts[key] = winner_stat_count
-        elif total_stats == existing_stats and scoreboard_len > existing_scoreboard:
-            best_by_key[key] = game
-            winner_counts[key] = winner_stat_count
-        elif total_stats == existing_stats and scoreboard_len == existing_scoreboard and winner_stat_count > existing_winner_stat:
-            best_by_key[key] = game
-            winner_counts[key] = winner_stat_count
-
-    unique_games = list(best_by_key.values())
-    unique_games.sort(
-        key=lambda item: _parse_game_datetime(item.get("datetime"))
-        or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
-    return unique_games
+    ranked = sorted(best_by_key.values(), key=itemgetter(0), reverse=True)
+    return [game for _, _, game in ranked]
 
 
-def _sorted_games(games: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    enriched: List[tuple[datetime, Dict[str, object]]] = []
-    for game in games:
-        dt = _parse_game_datetime(game.get("datetime"))
-        if dt is None:
-            dt = datetime.min.replace(tzinfo=timezone.utc)
-        enriched.append((dt, game))
-    enriched.sort(key=lambda item: item[0], reverse=True)
-    return [item[1] for item in enriched]
+def _first_touch_order(home: str, away: str, home_score: int, away_score: int) -> Tuple[str, str]:
+    # The original tally touched the winner first, so that order decides ties in the final sort.
+    return (away, home) if away_score > home_score else (home, away)
 
 
-def _summarize_recent_results(games: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    summary: Dict[str, Dict[str, int]] = defaultdict(lambda: {"played": 0, "wins": 0, "losses": 0, "ties": 0})
+def _tally_loop(rows: List[Tuple[str, str, int, int]]) -> Dict[str, Dict[str, int]]:
+    order: Dict[str, None] = {}
+    played: Counter[str] = Counter()
+    wins: Counter[str] = Counter()
+    losses: Counter[str] = Counter()
+    ties: Counter[str] = Counter()
+    for home, away, home_score, away_score in rows:
+        order.update(dict.fromkeys(_first_touch_order(home, away, home_score, away_score)))
+        if home_score > away_score:
+            wins[home] += 1
+            losses[away] += 1
+        elif away_score > home_score:
+            wins[away] += 1
+            losses[home] += 1
+        else:
+            ties[home] += 1
+            ties[away] += 1
+        played[home] += 1
+        played[away] += 1
+
+    return {
+        team: {"played": played[team], "wins": wins[team], "losses": losses[team], "ties": ties[team]}
+        for team in order
+    }
+
 
+def _summarize_recent_results(games: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    rows: List[Tuple[str, str, int, int]] = []
     for game in games:
-        home = str(game.get("home"))
-        away = str(game.get("away"))
         try:
             home_score = int(game.get("home_score"))
             away_score = int(game.get("away_score"))
         except (TypeError, ValueError):
             continue
+        rows.append((str(game.get("home")), str(game.get("away")), home_score, away_score))
 
-        if home_score > away_score:
-            summary[home]["wins"] += 1
-            summary[away]["losses"] += 1
-        elif away_score > home_score:
-            summary[away]["wins"] += 1
-            summary[home]["losses"] += 1
-        else:
-            summary[home]["ties"] += 1
-            summary[away]["ties"] += 1
-
-        summary[home]["played"] += 1
-        summary[away]["played"] += 1
+    summary = _tally_loop(rows)
 
     standings = [
         {"team": team, **stats}
@@ -572,8 +727,10 @@ def main() -> None:
     previous_snapshot = _load_standings_snapshot(previous)
 
     movements = _compute_movements(current_snapshot, previous_snapshot)
-    recent_games = _load_recent_results(days=7)
-    all_games = _unique_games(_sorted_games(_load_recent_results(days=None)))
+    now = datetime.now(timezone.utc)
+    recent_games = _load_recent_results(days=7, now=now)
+    # _dedup_and_sort lets earlier games win score ties, and _load_recent_results already yields newest first.
+    all_games = _dedup_and_sort(_load_recent_results(days=None, now=now))
     recent_summary = _summarize_recent_results(recent_games)
     headline_index = _load_headline_index()
 
@@ -581,9 +738,23 @@ def main() -> None:
     standings_data = _load_json(DATA_DIR / "standings.json")
     standings_list = standings_data if isinstance(standings_data, list) else []
 
-    headline_entries = _ensure_headlines(all_games, headline_index, standings=standings_list)
+    # Index and rank the standings once so each narrative does not rebuild them.
+    standings_by_team = index_standings(standings_list) if index_standings is not None else None
+    rank_map = rank_standings(standings_list) if rank_standings is not None else None
+
+    headline_entries = _ensure_headlines(
+        all_games,
+        headline_index,
+        standings=standings_list,
+        now=now,
+        standings_by_team=standings_by_team,
+        rank_map=rank_map,
+    )
+    if compact_cache is not None:
+        # Fold this run's AI cache appends into the committed JSON snapshot.
+        compact_cache()
 
-    generated_at = datetime.now(timezone.utc).isoformat()
+    generated_at = now.isoformat()
     report = {
         "generated_at": generated_at,
         "standings_snapshot": latest.name if latest else None,
@@ -601,12 +772,14 @@ def main() -> None:
     }
 
     REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    REPORT_PATH.write_text(json.dumps(report, indent=2), encoding="utf-8")
-
-    HEADLINES_PATH.write_text(
-        json.dumps({"generated_at": generated_at, "headlines": headline_entries}, indent=2),
-        encoding="utf-8",
-    )
+    # The two outputs are independent, so overlap their writes.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [
+            executor.submit(_dump_json, report, REPORT_PATH),
+            executor.submit(_dump_json, {"generated_at": generated_at, "headlines": headline_entries}, HEADLINES_PATH),
+        ]
+    for write in writes:
+        write.result()
 
     if build_player_registry_main is not None:
         build_player_registry_main()
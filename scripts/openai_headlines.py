@@ -5,25 +5,189 @@ OpenAI integration for generating polished game headlines and summaries.
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
 import os
 import hashlib
-from datetime import datetime, timezone
+import importlib.util
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+# httpx (bundled with openai) only negotiates HTTP/2 when the h2 package is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = PROJECT_ROOT / "data"
 CACHE_PATH = DATA_DIR / "ai_headlines_cache.json"
+# Games per chat completion in generate_ai_headlines_batch.
+HEADLINE_BATCH_SIZE = 10
+# Upper bound on OpenAI requests in flight at once.
+MAX_CONCURRENT_REQUESTS = max(1, int(os.getenv("AI_WORKERS", "8")))
+# Client-side request/token budgets (per minute) so concurrent batches stay under the
+# account's rate limits instead of bouncing off 429s; skipped without aiolimiter.
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "200000"))
+_RPM_LIMITER = AsyncLimiter(OPENAI_RPM, 60) if AsyncLimiter is not None else None
+_TPM_LIMITER = AsyncLimiter(OPENAI_TPM, 60) if AsyncLimiter is not None else None
+# Batch API bookkeeping: custom ids are "<cache key>|<game id>".
+_BATCH_ID_SEPARATOR = "|"
+_BATCH_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
+# New cache entries are appended here and folded into CACHE_PATH by compact_cache().
+CACHE_LOG_PATH = CACHE_PATH.with_suffix(".jsonl")
+# Headlines and narratives may be generated from worker threads; serialize cache file access.
+_CACHE_LOCK = threading.RLock()
+# Per-game coerced scores and sorted scoring lines; see _normalize_game.
+_NORMALIZED: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_NORMALIZED_MAX = 1024
+# Legacy MD5 keys re-recorded under blake2b keys, dropped at the next compaction.
+_MIGRATED_KEYS: Set[str] = set()
+# Failed generations are cached as negative entries and retried once this old.
+FAILURE_TTL = timedelta(hours=1)
+# Shared synchronous client; see _client().
+_CLIENT: Optional[Any] = None
+_CLIENT_LOCK = threading.Lock()
+# In-memory cache, loaded on first use by _load_cache().
+_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+# Prompt templates, filled with str.format_map so each prompt's stats are rendered once.
+# Headline style rules live in the system prompt so the per-game user prompt stays a single
+# compact line (roughly a tenth of the old multi-paragraph prompt).
+HEADLINE_SYSTEM_PROMPT = (
+    "You write hockey game headlines for a local adult league in sports-news style. "
+    "Rules: max 120 characters; active, dynamic verbs (dominates, edges, powers past); "
+    "lead with the winner and score, or both teams and the score for a tie; "
+    "name standout performers (hat trick = 3+ goals, multi-point games); "
+    "output only the headline text, no quotes."
+)
+
+WIN_HEADLINE_TMPL = "WIN: {winner} {winner_score}-{loser_score} vs {loser}. Top: {winner_csv}. Opp: {loser_csv}."
+
+TIE_HEADLINE_TMPL = "TIE: {home} {home_score}-{away_score} {away}. {home}: {home_csv}. {away}: {away_csv}."
+
+BATCH_HEADLINE_TMPL = """One headline per game. Reply as JSON {{"headlines": [{{"id": N, "text": "..."}}]}}.
+{games}"""
+
+# Structured-output schemas: the model returns the headline text itself rather than free-form
+# prose. Strict mode has no string length keywords, so the 120-character limit stays in the
+# system prompt and _clean_headline still guards the parsed text.
+HEADLINE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "headline",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"headline": {"type": "string"}},
+            "required": ["headline"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+BATCH_HEADLINE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "headlines",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "headlines": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "text": {"type": "string"},
+                        },
+                        "required": ["id", "text"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["headlines"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Summary and narrative instructions are likewise fixed system prompts, with the game data
+# last in the user message, so every call shares the same leading tokens and is eligible
+# for OpenAI's automatic prefix caching.
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a professional sports journalist writing brief game recaps for a local hockey league. "
+    "Requirements: 2-3 sentences maximum; professional sports recap style; "
+    "mention the final score and key performers; note any hat tricks (3+ goals) or multi-point games; "
+    "active, engaging voice."
+)
+
+SUMMARY_TMPL = """Final Score: {away} {away_score}, {home} {home_score}
+
+{home} Performers:
+{home_stats}
+
+{away} Performers:
+{away_stats}
+
+Summary:"""
+
+NARRATIVE_SYSTEM_PROMPT = """You write factual game recaps for the Amherst Adult Hockey League. Recaps display on a TV in the arena.
+
+WRITE A 2-3 SENTENCE RECAP:
+- State the final score and winning team, or the tie score if the game ended in a tie
+- Name the top scorer(s) with their actual stats (e.g., "Isaac Bridge led the way with 4 goals and an assist"); for a tie, name top scorers from each team
+- If someone scored 3+ goals, call it a hat trick
+- If someone had 4+ points, mention their "X-point night"
+- Optionally mention standings context if provided
+- Only mention stats explicitly provided - never invent or assume details
+- Professional but casual tone suitable for a local league"""
+
+WIN_NARRATIVE_TMPL = """FINAL: {winner} {winner_score}, {loser} {loser_score}
+
+{standings_context}
+
+{winner} Scoring:
+{winner_stats}
+
+{loser} Scoring:
+{loser_stats}
+
+RECAP:"""
+
+TIE_NARRATIVE_TMPL = """FINAL: {home} {home_score}, {away} {away_score} (TIE)
+
+{standings_context}
+
+{home} Scoring:
+{home_stats}
+
+{away} Scoring:
+{away_stats}
+
+RECAP:"""
 
 
 def _safe_int(value: Any) -> Optional[int]:
+    # Scraped scores and stats are almost always plain ints already.
+    if type(value) is int:
+        return value
     if isinstance(value, bool):
         return int(value)
     if isinstance(value, int):
@@ -47,52 +211,271 @@ def _team_name(game: Dict[str, Any], side: str) -> str:
     return "Unknown"
 
 
+def _normalize_game(game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the game's scores and per-side scoring lines, coerced and sorted once.
+
+    ``players`` maps each side to ``(name, goals, assists)`` tuples ordered by points,
+    highest first. Results are memoized per game object for the life of the process,
+    so games should not be edited after they are first passed in.
+    """
+    cached = _NORMALIZED.get(id(game))
+    # The stored game reference keeps the id from being reused while the entry exists.
+    if cached is not None and cached[0] is game:
+        return cached[1]
+
+    stats = game.get("player_stats") or {}
+    players: Dict[str, List[Tuple[Any, int, int]]] = {}
+    for side in ("home", "away"):
+        rows = [
+            (player.get("name", "Unknown"), _safe_int(player.get("goals")) or 0, _safe_int(player.get("assists")) or 0)
+            for player in stats.get(side) or []
+        ]
+        rows.sort(key=lambda row: row[1] + row[2], reverse=True)
+        players[side] = rows
+
+    normalized = {
+        "home_score": _safe_int(game.get("home_score")),
+        "away_score": _safe_int(game.get("away_score")),
+        "players": players,
+    }
+    if len(_NORMALIZED) >= _NORMALIZED_MAX:
+        _NORMALIZED.clear()
+    _NORMALIZED[id(game)] = (game, normalized)
+    return normalized
+
+
+def _scores(game: Dict[str, Any]) -> Tuple[int, int]:
+    """Home and away scores, treating missing values as 0."""
+    normalized = _normalize_game(game)
+    return normalized["home_score"] or 0, normalized["away_score"] or 0
+
+
 def _format_player_stats(game: Dict[str, Any], side: str) -> str:
     """Format player statistics for a team in a game."""
-    stats = game.get("player_stats", {})
-    players = stats.get(side, [])
+    players = _normalize_game(game)["players"].get(side)
     if not players:
         return "No player stats available"
 
-    lines = []
-    for player in sorted(players, key=lambda p: (_safe_int(p.get("goals")) or 0) + (_safe_int(p.get("assists")) or 0), reverse=True)[:5]:
-        name = player.get("name", "Unknown")
-        goals = _safe_int(player.get("goals")) or 0
-        assists = _safe_int(player.get("assists")) or 0
-        if goals or assists:
-            lines.append(f"  - {name}: {goals}G, {assists}A")
+    lines = [
+        f"  - {name}: {goals}G, {assists}A"
+        for name, goals, assists in players[:5]
+        if goals or assists
+    ]
 
     return "\n".join(lines) if lines else "No scoring"
 
 
-def _game_hash(game: Dict[str, Any]) -> str:
-    """Create a unique hash for a game based on key attributes."""
+def _stats_csv(game: Dict[str, Any], side: str) -> str:
+    """Compact scoring line for headline prompts, e.g. ``Name 2G1A; Name 1G2A``."""
+    players = _normalize_game(game)["players"].get(side) or []
+    parts = [f"{name} {goals}G{assists}A" for name, goals, assists in players[:5] if goals or assists]
+    return "; ".join(parts) if parts else "no scoring"
+
+
+def _game_key_text(game: Dict[str, Any]) -> str:
     home = _team_name(game, "home")
     away = _team_name(game, "away")
-    home_score = _safe_int(game.get("home_score")) or 0
-    away_score = _safe_int(game.get("away_score")) or 0
+    home_score, away_score = _scores(game)
     game_id = game.get("game_id", "")
+    return f"{game_id}:{home}:{away}:{home_score}:{away_score}"
 
-    key = f"{game_id}:{home}:{away}:{home_score}:{away_score}"
-    return hashlib.md5(key.encode()).hexdigest()
 
+def _game_hash(game: Dict[str, Any]) -> str:
+    """Create a unique hash for a game based on key attributes."""
+    return hashlib.blake2b(_game_key_text(game).encode(), digest_size=8).hexdigest()
 
-def _load_cache() -> Dict[str, Dict[str, Any]]:
-    """Load the AI headlines cache."""
-    if not CACHE_PATH.exists():
-        return {}
+
+def _legacy_game_hash(game: Dict[str, Any]) -> str:
+    """MD5 key used by cache entries written before the switch to blake2b."""
+    return hashlib.md5(_game_key_text(game).encode()).hexdigest()
+
+
+def _cached_entry(game: Dict[str, Any], game_key: str, suffix: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Look up ``game_key + suffix`` in the cache, falling back to the legacy MD5 key.
+
+    Legacy hits are re-recorded under the new key, and the old key is dropped at the
+    next compact_cache(), so the cache migrates as games are looked up.
+    """
+    cache = _load_cache()
+    entry = cache.get(game_key + suffix)
+    if entry is not None:
+        if _failure_expired(entry):
+            with _CACHE_LOCK:
+                cache.pop(game_key + suffix, None)
+            return None
+        return entry
+    legacy_key = _legacy_game_hash(game) + suffix
+    entry = cache.get(legacy_key)
+    if entry is not None:
+        _append_cache({game_key + suffix: entry})
+        _MIGRATED_KEYS.add(legacy_key)
+    return entry
+
+
+def _failure_entry(game: Dict[str, Any], field: str, error: Any) -> Dict[str, Any]:
+    """Negative cache entry recording a failed generation of ``field``."""
+    return {
+        field: None,
+        "error": str(error),
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "game_id": game.get("game_id")
+    }
+
+
+def _failure_expired(entry: Dict[str, Any]) -> bool:
+    """True for a negative entry older than FAILURE_TTL (or with an unreadable timestamp)."""
+    failed_at = entry.get("failed_at")
+    if failed_at is None:
+        return False
     try:
-        with CACHE_PATH.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+        return datetime.now(timezone.utc) - datetime.fromisoformat(failed_at) > FAILURE_TTL
+    except (TypeError, ValueError):
+        return True
 
 
-def _save_cache(cache: Dict[str, Dict[str, Any]]) -> None:
-    """Save the AI headlines cache."""
-    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with CACHE_PATH.open("w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2)
+def _load_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the AI headlines cache, reading it from disk on first use.
+
+    The snapshot in CACHE_PATH is loaded and the entries appended to
+    CACHE_LOG_PATH since the last compaction are replayed on top.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is not None:
+            return _CACHE
+        cache: Dict[str, Dict[str, Any]] = {}
+        if CACHE_PATH.exists():
+            try:
+                with CACHE_PATH.open("r", encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                cache = {}
+        if CACHE_LOG_PATH.exists():
+            try:
+                with CACHE_LOG_PATH.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            cache.update(json.loads(line))
+                        except json.JSONDecodeError:
+                            # A run killed mid-append can leave a torn last line.
+                            continue
+            except IOError:
+                pass
+        _CACHE = cache
+        return _CACHE
+
+
+def _append_cache(entries: Dict[str, Dict[str, Any]]) -> None:
+    """Record new cache entries in memory and append them to the cache log."""
+    if not entries:
+        return
+    with _CACHE_LOCK:
+        _load_cache().update(entries)
+        CACHE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with CACHE_LOG_PATH.open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps({key: entry}) + "\n" for key, entry in entries.items())
+
+
+def compact_cache() -> None:
+    """Fold the cache log into the JSON snapshot and remove the log."""
+    with _CACHE_LOCK:
+        if not CACHE_LOG_PATH.exists():
+            return
+        cache = _load_cache()
+        for legacy_key in _MIGRATED_KEYS:
+            cache.pop(legacy_key, None)
+        _MIGRATED_KEYS.clear()
+        for key in [key for key, entry in cache.items() if _failure_expired(entry)]:
+            del cache[key]
+        tmp_path = CACHE_PATH.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, CACHE_PATH)
+        CACHE_LOG_PATH.unlink()
+
+
+@lru_cache(maxsize=None)
+def _api_key() -> Optional[str]:
+    """OPENAI_API_KEY, read from the environment once per process."""
+    return os.environ.get("OPENAI_API_KEY") or None
+
+
+def _client() -> Any:
+    """Return the shared OpenAI client so every call reuses one connection pool."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = OpenAI(api_key=_api_key())
+    return _CLIENT
+
+
+def _game_context(game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect the fields the prompt templates use, rendering each side's stats once.
+
+    ``winner`` is None for a tie; otherwise the winner/loser fields are filled in too.
+    """
+    home = _team_name(game, "home")
+    away = _team_name(game, "away")
+    home_score, away_score = _scores(game)
+    ctx: Dict[str, Any] = {
+        "home": home,
+        "away": away,
+        "home_score": home_score,
+        "away_score": away_score,
+        "home_stats": _format_player_stats(game, "home"),
+        "away_stats": _format_player_stats(game, "away"),
+        "home_csv": _stats_csv(game, "home"),
+        "away_csv": _stats_csv(game, "away"),
+        "winner": None,
+    }
+    if home_score > away_score:
+        ctx.update(winner=home, loser=away, winner_score=home_score, loser_score=away_score,
+                   winner_stats=ctx["home_stats"], loser_stats=ctx["away_stats"],
+                   winner_csv=ctx["home_csv"], loser_csv=ctx["away_csv"])
+    elif away_score > home_score:
+        ctx.update(winner=away, loser=home, winner_score=away_score, loser_score=home_score,
+                   winner_stats=ctx["away_stats"], loser_stats=ctx["home_stats"],
+                   winner_csv=ctx["away_csv"], loser_csv=ctx["home_csv"])
+    return ctx
+
+
+def _headline_line(game: Dict[str, Any]) -> str:
+    """One-line result and scorers summary used in headline prompts."""
+    ctx = _game_context(game)
+    return (WIN_HEADLINE_TMPL if ctx["winner"] else TIE_HEADLINE_TMPL).format_map(ctx)
+
+
+def _clean_headline(text: str) -> str:
+    """Strip wrapping quotes and cap overlong model output."""
+    headline = text.strip().strip('"\'')
+    if len(headline) > 150:
+        headline = headline[:147] + "..."
+    return headline
+
+
+def _headline_request(game: Dict[str, Any]) -> Dict[str, Any]:
+    """Chat completion parameters for a single-game headline."""
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": HEADLINE_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": f"{_headline_line(game)}\nHEADLINE:"
+            }
+        ],
+        "response_format": HEADLINE_RESPONSE_FORMAT,
+        "max_tokens": 64,
+        "temperature": 0.7,
+    }
 
 
 def generate_ai_headline(game: Dict[str, Any], use_cache: bool = True) -> Optional[str]:
@@ -110,184 +493,330 @@ def generate_ai_headline(game: Dict[str, Any], use_cache: bool = True) -> Option
         print("OpenAI library not available. Install with: pip install openai")
         return None
 
-    api_key = os.environ.get("OPENAI_API_KEY")
+    api_key = _api_key()
     if not api_key:
         return None
 
     # Check cache
     game_key = _game_hash(game)
     if use_cache:
-        cache = _load_cache()
-        if game_key in cache:
-            return cache[game_key].get("headline")
+        cached = _cached_entry(game, game_key)
+        if cached is not None:
+            return cached.get("headline")
 
-    # Extract game data
-    home = _team_name(game, "home")
-    away = _team_name(game, "away")
-    home_score = _safe_int(game.get("home_score")) or 0
-    away_score = _safe_int(game.get("away_score")) or 0
+    try:
+        client = _client()
+        response = client.chat.completions.create(**_headline_request(game))
 
-    # Determine winner
-    if home_score > away_score:
-        winner, loser = home, away
-        winner_score, loser_score = home_score, away_score
-        winner_side = "home"
-    elif away_score > home_score:
-        winner, loser = away, home
-        winner_score, loser_score = away_score, home_score
-        winner_side = "away"
-    else:
-        winner = loser = None
-        winner_score = loser_score = home_score
-        winner_side = None
+        headline = _clean_headline(json.loads(response.choices[0].message.content)["headline"])
 
-    # Build context
-    home_stats = _format_player_stats(game, "home")
-    away_stats = _format_player_stats(game, "away")
+        # Cache the result
+        _append_cache({
+            game_key: {
+                "headline": headline,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "game_id": game.get("game_id")
+            }
+        })
 
-    # Construct prompt
-    if winner:
-        prompt = f"""Generate a concise, engaging sports headline for this hockey game result.
+        return headline
 
-Game Result: {winner} defeats {loser}, {winner_score}-{loser_score}
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        _append_cache({game_key: _failure_entry(game, "headline", e)})
+        return None
 
-{winner} Top Performers:
-{_format_player_stats(game, winner_side)}
 
-{loser} Top Performers:
-{_format_player_stats(game, "away" if winner_side == "home" else "home")}
+def _batch_headline_prompt(games: List[Dict[str, Any]]) -> str:
+    """Build the user prompt asking for one numbered headline per game."""
+    lines = "\n".join(f"{number}. {_headline_line(game)}" for number, game in enumerate(games, 1))
+    return BATCH_HEADLINE_TMPL.format_map({"games": lines})
 
-Requirements:
-- Maximum 120 characters
-- Highlight the winning team and score
-- Mention the top performer(s) if they had notable stats (hat trick = 3+ goals, multi-point game)
-- Use active, dynamic language (e.g., "dominates", "edges", "powers past")
-- No quotes, just the headline text
-- Sports news style, professional tone
 
-Headline:"""
-    else:
-        prompt = f"""Generate a concise, engaging sports headline for this hockey game that ended in a tie.
+def _estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the completion cap."""
+    return len(prompt) // 4 + max_tokens
 
-Game Result: {home} ties {away}, {home_score}-{away_score}
 
-{home} Top Performers:
-{home_stats}
+async def _throttle(tokens: int) -> None:
+    """Wait for request and token budget when aiolimiter is installed."""
+    if _RPM_LIMITER is None:
+        return
+    await _RPM_LIMITER.acquire()
+    await _TPM_LIMITER.acquire(min(tokens, OPENAI_TPM))
+
+
+async def _arequest_headline_batch(
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    games: List[Dict[str, Any]],
+) -> Dict[int, str]:
+    """Request headlines for one batch; returns them by game number (empty on failure)."""
+    prompt = _batch_headline_prompt(games)
+    max_tokens = 64 * len(games) + 20
+    request = {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": HEADLINE_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "response_format": BATCH_HEADLINE_RESPONSE_FORMAT,
+        "max_tokens": max_tokens,
+        "temperature": 0.7,
+    }
+    try:
+        async with semaphore:
+            await _throttle(_estimate_tokens(prompt, max_tokens))
+            response = await client.chat.completions.create(**request)
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        return {}
 
-{away} Top Performers:
-{away_stats}
+    try:
+        payload = json.loads(response.choices[0].message.content)
+        return {item["id"]: _clean_headline(item["text"]) for item in payload["headlines"]}
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        print(f"Unexpected headline batch reply: {e}")
+        return {}
 
-Requirements:
-- Maximum 120 characters
-- Mention both teams and the tie score
-- Highlight any standout performers
-- Use engaging language appropriate for a tie
-- No quotes, just the headline text
-- Sports news style, professional tone
 
-Headline:"""
+def _async_client(api_key: str) -> Any:
+    """
+    AsyncOpenAI client for concurrent headline batches.
 
-    try:
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional sports journalist writing concise, engaging hockey game headlines. Keep headlines under 120 characters, use active voice, and highlight key performers."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_tokens=100,
-            temperature=0.7
-        )
+    Its httpx transport multiplexes requests over HTTP/2 when h2 is installed, while
+    the SDK keeps its retry and backoff handling for 429s and 5xx responses.
+    """
+    return AsyncOpenAI(api_key=api_key, http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE))
 
-        headline = response.choices[0].message.content.strip()
 
-        # Clean up the headline
-        headline = headline.strip('"\'')
-        if len(headline) > 150:
-            headline = headline[:147] + "..."
+async def _agenerate_headline_batches(api_key: str, batches: List[List[Dict[str, Any]]]) -> List[Dict[int, str]]:
+    """Send every batch concurrently over one shared client, at most MAX_CONCURRENT_REQUESTS at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with _async_client(api_key) as client:
+        return await asyncio.gather(*(_arequest_headline_batch(client, semaphore, batch) for batch in batches))
 
-        # Cache the result
-        cache = _load_cache()
-        cache[game_key] = {
-            "headline": headline,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "game_id": game.get("game_id")
-        }
-        _save_cache(cache)
 
-        return headline
+def generate_ai_headlines_batch(games: List[Dict[str, Any]], use_cache: bool = True) -> List[Optional[str]]:
+    """
+    Generate AI headlines for several games with one chat completion per batch.
 
-    except Exception as e:
-        print(f"OpenAI API error: {e}")
-        return None
+    Duplicate games are requested once. Cached games are answered from the cache;
+    the rest are sent in groups of HEADLINE_BATCH_SIZE, each returning a JSON
+    object of numbered headlines. The batches are issued concurrently.
 
+    Args:
+        games: Game data dictionaries with scores and player stats
+        use_cache: Whether to use cached headlines
 
-def generate_game_summary(game: Dict[str, Any]) -> Optional[str]:
+    Returns:
+        Headlines aligned with ``games`` (None where generation failed)
     """
-    Generate a brief game summary paragraph using OpenAI.
+    headlines: List[Optional[str]] = [None] * len(games)
+    if not OPENAI_AVAILABLE:
+        print("OpenAI library not available. Install with: pip install openai")
+        return headlines
+
+    api_key = _api_key()
+    if not api_key:
+        return headlines
+
+    keys = [_game_hash(game) for game in games]
+    # Duplicate games share a key; only the first occurrence is looked up or requested.
+    first_index: Dict[str, int] = {}
+    pending: List[int] = []
+    for index, key in enumerate(keys):
+        if key in first_index:
+            continue
+        first_index[key] = index
+        cached = _cached_entry(games[index], key) if use_cache else None
+        if cached is not None:
+            headlines[index] = cached.get("headline")
+        else:
+            pending.append(index)
+
+    if pending:
+        batches = [pending[start:start + HEADLINE_BATCH_SIZE] for start in range(0, len(pending), HEADLINE_BATCH_SIZE)]
+        results = asyncio.run(
+            _agenerate_headline_batches(api_key, [[games[index] for index in batch] for batch in batches])
+        )
+
+        generated_at = datetime.now(timezone.utc).isoformat()
+        new_entries: Dict[str, Dict[str, Any]] = {}
+        for batch, by_number in zip(batches, results):
+            for number, index in enumerate(batch, 1):
+                text = by_number.get(number)
+                if not text:
+                    new_entries[keys[index]] = _failure_entry(games[index], "headline", "no headline returned")
+                    continue
+                headlines[index] = text
+                new_entries[keys[index]] = {
+                    "headline": text,
+                    "generated_at": generated_at,
+                    "game_id": games[index].get("game_id")
+                }
+        _append_cache(new_entries)
+
+    if len(first_index) < len(games):
+        headlines = [headlines[first_index[key]] for key in keys]
+    return headlines
+
+
+def submit_headlines_batch(games: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Queue headline requests for uncached games on the OpenAI Batch API.
+
+    Batch jobs run at half price within a 24-hour window and do not count
+    against the per-minute rate limits; ingest them with poll_and_ingest_batch.
 
     Args:
-        game: Game data dictionary
+        games: Game data dictionaries with scores and player stats
 
     Returns:
-        AI-generated summary or None if generation fails
+        The batch id, or None when nothing was submitted
     """
     if not OPENAI_AVAILABLE:
+        print("OpenAI library not available. Install with: pip install openai")
         return None
 
-    api_key = os.environ.get("OPENAI_API_KEY")
+    api_key = _api_key()
     if not api_key:
         return None
 
-    home = _team_name(game, "home")
-    away = _team_name(game, "away")
-    home_score = _safe_int(game.get("home_score")) or 0
-    away_score = _safe_int(game.get("away_score")) or 0
+    lines = []
+    seen = set()
+    for game in games:
+        game_key = _game_hash(game)
+        if game_key in seen or _cached_entry(game, game_key) is not None:
+            continue
+        seen.add(game_key)
+        lines.append(json.dumps({
+            # The game id rides along so ingested entries match those written by the live path.
+            "custom_id": f"{game_key}{_BATCH_ID_SEPARATOR}{game.get('game_id', '')}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _headline_request(game),
+        }))
+    if not lines:
+        return None
+
+    try:
+        client = _client()
+        upload = client.files.create(
+            file=("headlines.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+    except Exception as e:
+        print(f"OpenAI API error submitting batch: {e}")
+        return None
 
-    home_stats = _format_player_stats(game, "home")
-    away_stats = _format_player_stats(game, "away")
+    return batch.id
 
-    prompt = f"""Write a brief 2-3 sentence game summary for this hockey game.
 
-Final Score: {away} {away_score}, {home} {home_score}
+def poll_and_ingest_batch(batch_id: str, poll_interval: float = 60.0) -> int:
+    """
+    Wait for a headline batch to finish and merge its results into the cache.
 
-{home} Performers:
-{home_stats}
+    Args:
+        batch_id: Id returned by submit_headlines_batch
+        poll_interval: Seconds between status checks
 
-{away} Performers:
-{away_stats}
+    Returns:
+        Number of headlines added to the cache
+    """
+    if not OPENAI_AVAILABLE:
+        print("OpenAI library not available. Install with: pip install openai")
+        return 0
+
+    api_key = _api_key()
+    if not api_key:
+        return 0
+
+    try:
+        client = _client()
+        batch = client.batches.retrieve(batch_id)
+        while batch.status in _BATCH_PENDING_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"Batch {batch_id} ended with status {batch.status}")
+            return 0
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        print(f"OpenAI API error retrieving batch {batch_id}: {e}")
+        return 0
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    new_entries: Dict[str, Dict[str, Any]] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            headline = _clean_headline(json.loads(content)["headline"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+        game_key, _, game_id = str(record.get("custom_id", "")).partition(_BATCH_ID_SEPARATOR)
+        new_entries[game_key] = {
+            "headline": headline,
+            "generated_at": generated_at,
+            "game_id": game_id or None
+        }
+    _append_cache(new_entries)
+    return len(new_entries)
 
-Requirements:
-- 2-3 sentences maximum
-- Professional sports recap style
-- Mention the final score and key performers
-- Note any hat tricks (3+ goals) or multi-point games
-- Active, engaging voice
 
-Summary:"""
+def generate_game_summary(game: Dict[str, Any]) -> Optional[str]:
+    """
+    Generate a brief game summary paragraph using OpenAI.
+
+    Args:
+        game: Game data dictionary
+
+    Returns:
+        AI-generated summary or None if generation fails
+    """
+    if not OPENAI_AVAILABLE:
+        return None
+
+    api_key = _api_key()
+    if not api_key:
+        return None
+
+    prompt = SUMMARY_TMPL.format_map(_game_context(game))
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = _client()
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a professional sports journalist writing brief game recaps for a local hockey league."
+                    "content": SUMMARY_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            max_tokens=200,
-            temperature=0.7
+            max_tokens=100,
+            temperature=0.7,
+            stop=["\n\n"]
         )
 
         return response.choices[0].message.content.strip()
@@ -297,10 +826,27 @@ Summary:"""
         return None
 
 
+def index_standings(standings: Optional[List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Map lowercased team names to their standings rows (later duplicates win)."""
+    if not standings:
+        return {}
+    return {s.get("team", "").lower(): s for s in standings if isinstance(s, dict)}
+
+
+def rank_standings(standings: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+    """Map lowercased team names to their 1-based rank by points (later duplicates win)."""
+    if not standings:
+        return {}
+    ordered = sorted(standings, key=lambda x: _safe_int(x.get("points")) or 0, reverse=True)
+    return {team.get("team", "").lower(): rank for rank, team in enumerate(ordered, 1)}
+
+
 def generate_rich_narrative(
     game: Dict[str, Any],
     standings: Optional[List[Dict[str, Any]]] = None,
-    use_cache: bool = True
+    use_cache: bool = True,
+    standings_by_team: Optional[Dict[str, Dict[str, Any]]] = None,
+    rank_map: Optional[Dict[str, int]] = None,
 ) -> Optional[str]:
     """
     Generate a rich, extended narrative for a game result.
@@ -311,6 +857,9 @@ def generate_rich_narrative(
     Args:
         game: Game data dictionary with scores and player stats
         standings: Optional standings data for streak/playoff context
+        standings_by_team: Optional result of index_standings(standings), so callers
+            narrating many games can build the team lookup once
+        rank_map: Optional result of rank_standings(standings), likewise
         use_cache: Whether to use cached narratives
 
     Returns:
@@ -319,57 +868,37 @@ def generate_rich_narrative(
     if not OPENAI_AVAILABLE:
         return None
 
-    api_key = os.environ.get("OPENAI_API_KEY")
+    api_key = _api_key()
     if not api_key:
         return None
 
     # Check cache with different key for narratives
-    game_key = _game_hash(game) + "_narrative"
+    base_key = _game_hash(game)
+    game_key = base_key + "_narrative"
     if use_cache:
-        cache = _load_cache()
-        if game_key in cache:
-            return cache[game_key].get("narrative")
+        cached = _cached_entry(game, base_key, "_narrative")
+        if cached is not None:
+            return cached.get("narrative")
 
     # Extract game data
-    home = _team_name(game, "home")
-    away = _team_name(game, "away")
-    home_score = _safe_int(game.get("home_score")) or 0
-    away_score = _safe_int(game.get("away_score")) or 0
-
-    # Determine winner
-    if home_score > away_score:
-        winner, loser = home, away
-        winner_score, loser_score = home_score, away_score
-        winner_side, loser_side = "home", "away"
-    elif away_score > home_score:
-        winner, loser = away, home
-        winner_score, loser_score = away_score, home_score
-        winner_side, loser_side = "away", "home"
-    else:
-        winner = loser = None
-        winner_score = loser_score = home_score
-        winner_side = loser_side = None
+    ctx = _game_context(game)
+    home, away = ctx["home"], ctx["away"]
 
     # Build standings context
     standings_context = ""
     if standings:
-        standings_map = {s.get("team", "").lower(): s for s in standings if isinstance(s, dict)}
+        standings_map = standings_by_team if standings_by_team is not None else index_standings(standings)
 
         home_standing = standings_map.get(home.lower(), {})
         away_standing = standings_map.get(away.lower(), {})
 
         home_streak = home_standing.get("streak", "")
         away_streak = away_standing.get("streak", "")
-        home_rank = None
-        away_rank = None
 
         # Find ranks
-        sorted_standings = sorted(standings, key=lambda x: _safe_int(x.get("points")) or 0, reverse=True)
-        for i, team in enumerate(sorted_standings, 1):
-            if team.get("team", "").lower() == home.lower():
-                home_rank = i
-            if team.get("team", "").lower() == away.lower():
-                away_rank = i
+        ranks = rank_map if rank_map is not None else rank_standings(standings)
+        home_rank = ranks.get(home.lower())
+        away_rank = ranks.get(away.lower())
 
         standings_lines = []
         if home_streak:
@@ -400,88 +929,44 @@ def generate_rich_narrative(
         if lines:
             period_context = "Period Breakdown:\n" + "\n".join(lines)
 
-    # Player stats
-    winner_stats = _format_player_stats(game, winner_side) if winner_side else _format_player_stats(game, "home")
-    loser_stats = _format_player_stats(game, loser_side) if loser_side else _format_player_stats(game, "away")
-
     # Construct rich prompt - stick to facts we actually have
-    if winner:
-        prompt = f"""Write a game recap for this adult hockey league game. This displays on a TV in the arena.
-
-FINAL: {winner} {winner_score}, {loser} {loser_score}
-
-{standings_context}
-
-{winner} Scoring:
-{winner_stats}
-
-{loser} Scoring:
-{loser_stats}
-
-WRITE A 2-3 SENTENCE RECAP:
-- State the final score and winning team
-- Name the top scorer(s) with their actual stats (e.g., "Isaac Bridge led the way with 4 goals and an assist")
-- If someone scored 3+ goals, call it a hat trick
-- If someone had 4+ points, mention their "X-point night"
-- Optionally mention standings context if provided above
-- Keep it factual - only reference stats shown above
-- Professional but casual tone suitable for a local league
-
-RECAP:"""
-    else:
-        prompt = f"""Write a game recap for this adult hockey league game that ended in a tie. This displays on a TV in the arena.
-
-FINAL: {home} {home_score}, {away} {away_score} (TIE)
-
-{standings_context}
-
-{home} Scoring:
-{_format_player_stats(game, "home")}
-
-{away} Scoring:
-{_format_player_stats(game, "away")}
-
-WRITE A 2-3 SENTENCE RECAP:
-- State the tie score
-- Name top scorers from each team with their actual stats
-- Keep it factual - only reference stats shown above
-- Professional but casual tone suitable for a local league
-
-RECAP:"""
+    ctx["standings_context"] = standings_context
+    prompt = (WIN_NARRATIVE_TMPL if ctx["winner"] else TIE_NARRATIVE_TMPL).format_map(ctx)
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = _client()
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {
                     "role": "system",
-                    "content": "You write factual game recaps for the Amherst Adult Hockey League. Only mention stats explicitly provided - never invent or assume details. Keep recaps to 2-3 sentences."
+                    "content": NARRATIVE_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            max_tokens=150,
-            temperature=0.5
+            max_tokens=120,
+            temperature=0.3
         )
 
         narrative = response.choices[0].message.content.strip()
 
         # Cache the result
-        cache = _load_cache()
-        cache[game_key] = {
-            "narrative": narrative,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "game_id": game.get("game_id")
-        }
-        _save_cache(cache)
+        _append_cache({
+            game_key: {
+                "narrative": narrative,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "game_id": game.get("game_id")
+            }
+        })
 
         return narrative
 
     except Exception as e:
         print(f"OpenAI API error generating narrative: {e}")
+        _append_cache({game_key: _failure_entry(game, "narrative", e)})
         return None
 
 
@@ -496,32 +981,42 @@ def enrich_games_with_ai(games: List[Dict[str, Any]], max_games: int = 10) -> Li
     Returns:
         Enriched list of games with AI headlines
     """
-    enriched = []
-    processed = 0
-
-    for game in games:
-        game_copy = dict(game)
-
-        # Only generate AI headlines for games with scores
-        home_score = _safe_int(game.get("home_score"))
-        away_score = _safe_int(game.get("away_score"))
-
-        if home_score is not None and away_score is not None and processed < max_games:
-            ai_headline = generate_ai_headline(game)
-            if ai_headline:
-                game_copy["ai_headline"] = ai_headline
-                # Use AI headline as primary if no headline exists
-                if not game_copy.get("headline"):
-                    game_copy["headline"] = ai_headline
-            processed += 1
-
-        enriched.append(game_copy)
+    enriched = [dict(game) for game in games]
+
+    # Only generate AI headlines for games with scores
+    eligible = [
+        game_copy
+        for game_copy in enriched
+        if _safe_int(game_copy.get("home_score")) is not None and _safe_int(game_copy.get("away_score")) is not None
+    ][:max_games]
+
+    for game_copy, ai_headline in zip(eligible, generate_ai_headlines_batch(eligible)):
+        if ai_headline:
+            game_copy["ai_headline"] = ai_headline
+            # Use AI headline as primary if no headline exists
+            if not game_copy.get("headline"):
+                game_copy["headline"] = ai_headline
 
     return enriched
 
 
 def main():
     """Generate AI headlines for recent games."""
+    parser = argparse.ArgumentParser(description="Generate AI headlines for recent games.")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Queue uncached headlines on the OpenAI Batch API (half price, up to 24h) and wait for them",
+    )
+    parser.add_argument("--ingest-batch", metavar="BATCH_ID", help="Wait for an earlier batch and cache its headlines")
+    parser.add_argument("--limit", type=int, default=10, help="Number of most recent games to process (default: 10)")
+    args = parser.parse_args()
+
+    if args.ingest_batch:
+        print(f"Cached {poll_and_ingest_batch(args.ingest_batch)} headlines from batch {args.ingest_batch}")
+        compact_cache()
+        return
+
     results_path = DATA_DIR / "results.json"
     if not results_path.exists():
         print("No results.json found")
@@ -539,24 +1034,32 @@ def main():
         results,
         key=lambda g: g.get("datetime", ""),
         reverse=True
-    )[:10]
+    )[:args.limit]
 
     print(f"Processing {len(recent)} recent games...")
 
-    for game in recent:
+    if args.batch:
+        batch_id = submit_headlines_batch(recent)
+        if batch_id:
+            print(f"Submitted batch {batch_id}; waiting for results (resume with --ingest-batch {batch_id})")
+            print(f"Cached {poll_and_ingest_batch(batch_id)} headlines from batch {batch_id}")
+        else:
+            print("No batch submitted")
+
+    for game, headline in zip(recent, generate_ai_headlines_batch(recent)):
         game_id = game.get("game_id", "?")
         home = _team_name(game, "home")
         away = _team_name(game, "away")
-        home_score = _safe_int(game.get("home_score")) or 0
-        away_score = _safe_int(game.get("away_score")) or 0
+        home_score, away_score = _scores(game)
 
-        headline = generate_ai_headline(game)
         if headline:
             print(f"\nGame {game_id}: {away} {away_score} @ {home} {home_score}")
             print(f"  AI Headline: {headline}")
         else:
             print(f"\nGame {game_id}: Failed to generate headline")
 
+    compact_cache()
+
 
 if __name__ == "__main__":
     main()
@@ -6,7 +6,6 @@ Convenience wrapper around the aahlscraper diagnostics helpers.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -16,6 +15,7 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from aahlscraper import run_diagnostics, summarize_recommendation
+from aahlscraper.exporters import write_json
 
 
 def main() -> None:
@@ -26,13 +26,19 @@ def main() -> None:
         default="data/diagnostic_results.json",
         help="Path where diagnostic JSON results should be written",
     )
+    parser.add_argument(
+        "--cache",
+        default="data/.diag_cache.json",
+        help="File recording page validators and results for conditional re-checks",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached page results and re-analyze every page")
     args = parser.parse_args()
 
-    results = run_diagnostics(team_id=args.team)
+    cache_path = None if args.no_cache else Path(args.cache)
+    results = run_diagnostics(team_id=args.team, cache_path=cache_path)
 
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    write_json(results, output_path)
 
     print(f"Diagnostics for team {args.team}")
     for label, result in results.items():
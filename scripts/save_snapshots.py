@@ -5,32 +5,87 @@ Persist timestamped snapshots of key AAHL data outputs.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Dict, Iterable, Set
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = PROJECT_ROOT / "data"
 HISTORY_DIR = DATA_DIR / "history"
+# Per-directory digest index in sha256sum format ("<hex>  <name>"), so duplicate detection
+# compares hashes instead of re-reading every snapshot; `sha256sum -c SHA256SUMS` verifies it.
+INDEX_NAME = "SHA256SUMS"
+_HASH_CHUNK_SIZE = 64 * 1024
 
 
 def _utc_stamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def _latest_snapshot(directory: Path) -> Path | None:
-    if not directory.exists():
-        return None
-    snapshots = sorted(directory.glob("*.json"))
-    return snapshots[-1] if snapshots else None
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
+def _load_index(directory: Path) -> Dict[str, str]:
+    """
+    Map snapshot file names in ``directory`` to their SHA-256 digests, in name order.
 
-def _files_match(a: Path, b: Path) -> bool:
+    Digests come from the index file; snapshots missing from it (first run, or files
+    added by hand) are hashed, and entries for deleted snapshots are dropped.
+    """
+    recorded: Dict[str, str] = {}
     try:
-        return a.read_bytes() == b.read_bytes()
+        with (directory / INDEX_NAME).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                digest, sep, name = line.rstrip("\n").partition("  ")
+                if sep:
+                    recorded[name] = digest
     except FileNotFoundError:
-        return False
+        pass
+
+    index: Dict[str, str] = {}
+    for path in sorted(directory.glob("*.json")):
+        index[path.name] = recorded.get(path.name) or _sha256_file(path)
+    return index
+
+
+def _save_index(directory: Path, index: Dict[str, str]) -> None:
+    path = directory / INDEX_NAME
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text("".join(f"{digest}  {name}\n" for name, digest in index.items()), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _fast_copy(src: Path, dest: Path) -> None:
+    """
+    Copy ``src`` to ``dest`` in the kernel where possible, preserving metadata like copy2.
+
+    Linux uses copy_file_range (which can also reflink on CoW filesystems); elsewhere
+    shutil.copyfile already dispatches to sendfile/fcopyfile/CopyFile2.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with src.open("rb") as fin, dest.open("wb") as fout:
+                remaining = os.fstat(fin.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fin.fileno(), fout.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
 
 
 def _copy_if_exists(src: Path, dest: Path) -> bool:
@@ -39,12 +94,15 @@ def _copy_if_exists(src: Path, dest: Path) -> bool:
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    latest = _latest_snapshot(dest.parent)
-    if latest and _files_match(src, latest):
+    index = _load_index(dest.parent)
+    digest = _sha256_file(src)
+    if index and next(reversed(index.values())) == digest:
         print(f"Snapshot unchanged for {src.name}; skipping copy.")
         return False
 
-    shutil.copy2(src, dest)
+    _fast_copy(src, dest)
+    index[dest.name] = digest
+    _save_index(dest.parent, dict(sorted(index.items())))
     return True
 
 
@@ -52,21 +110,21 @@ def _prune_consecutive_duplicates(directory: Path) -> int:
     if not directory.exists():
         return 0
 
+    index = _load_index(directory)
+    kept: Dict[str, str] = {}
     removed = 0
-    last_bytes: bytes | None = None
-
-    for path in sorted(directory.glob("*.json")):
-        try:
-            current = path.read_bytes()
-        except FileNotFoundError:
-            continue
+    last_digest: str | None = None
 
-        if last_bytes is not None and current == last_bytes:
-            path.unlink(missing_ok=True)
+    for name, digest in index.items():
+        if digest == last_digest:
+            (directory / name).unlink(missing_ok=True)
             removed += 1
         else:
-            last_bytes = current
+            kept[name] = digest
+            last_digest = digest
 
+    if removed or not (directory / INDEX_NAME).exists():
+        _save_index(directory, kept)
     if removed:
         print(f"Pruned {removed} duplicate snapshot(s) from {directory.relative_to(HISTORY_DIR)}")
 
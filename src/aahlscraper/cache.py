@@ -0,0 +1,49 @@
+"""
+On-disk cache for fetched page bodies, keyed by URL with a freshness window.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Mapping, Optional
+from urllib.parse import urlencode
+
+
+class ResponseCache:
+    """
+    Store response text under ``<directory>/<sha1(url)>.html`` and serve it while
+    the file is younger than ``max_age`` seconds.
+    """
+
+    def __init__(self, directory: Path, max_age: float = 300) -> None:
+        self.directory = Path(directory)
+        self.max_age = max_age
+
+    def _path(self, url: str, params: Optional[Mapping[str, str]] = None) -> Path:
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.html"
+
+    def get(self, url: str, params: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        if self.max_age <= 0:
+            return None
+        path = self._path(url, params)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, url: str, text: str, params: Optional[Mapping[str, str]] = None) -> None:
+        path = self._path(url, params)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"Warning: could not write cache entry {path}: {exc}")
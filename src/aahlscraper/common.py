@@ -5,7 +5,8 @@ Common helpers shared across AAHL scraper modules.
 from __future__ import annotations
 
 import re
-from typing import Iterable, Optional, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 
 from bs4 import BeautifulSoup
@@ -13,43 +14,76 @@ from bs4.element import Tag
 
 
 BASE_URL = "https://www.amherstadulthockey.com/teams"
+_HEADER_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=32)
+def _build_url_cached(team_id: str, page_type: str, extra_items: Tuple[Tuple[str, str], ...]) -> str:
+    base_params = {"u": team_id, "s": "hockey", "p": page_type}
+    base_params.update(extra_items)
+    return f"{BASE_URL}/default.asp?{urlencode(base_params)}"
 
 
 def build_url(team_id: str, page_type: str, **params: str) -> str:
     """
     Build a fully qualified Amherst Adult Hockey League URL for a page type.
     """
-    base_params = {"u": team_id, "s": "hockey", "p": page_type}
-    base_params.update(params)
-    return f"{BASE_URL}/default.asp?{urlencode(base_params)}"
+    return _build_url_cached(team_id, page_type, tuple(params.items()))
 
 
-def find_best_table(
+def find_best_table_rows(
     soup: BeautifulSoup, class_candidates: Optional[Sequence[str]] = None
-) -> Optional[Tag]:
+) -> Tuple[Optional[Tag], List[Tag]]:
     """
-    Find the most likely table containing the page data.
-    Preference order:
-    1. First match using explicit class candidates.
-    2. Fallback to the table with the most rows.
+    Like find_best_table, but also return the chosen table's rows so callers
+    do not need to walk the table a second time.
     """
     if class_candidates:
         for candidate in class_candidates:
             table = soup.find("table", class_=candidate)
             if table:
-                return table
+                return table, table.find_all("tr")
+
+    best: Optional[Tag] = None
+    best_rows: List[Tag] = []
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if best is None or len(rows) > len(best_rows):
+            best, best_rows = table, rows
+    return best, best_rows
 
-    tables = soup.find_all("table")
-    if not tables:
-        return None
 
-    return max(tables, key=lambda table: len(table.find_all("tr")))
+def find_best_table(
+    soup: BeautifulSoup, class_candidates: Optional[Sequence[str]] = None
+) -> Optional[Tag]:
+    """
+    Find the most likely table containing the page data.
+    Preference order:
+    1. First match using explicit class candidates.
+    2. Fallback to the table with the most rows.
+    """
+    return find_best_table_rows(soup, class_candidates)[0]
 
 
 def normalize_header(text: str) -> str:
     """
     Convert a header label into a normalized, snake_case key.
     """
-    text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    return text.strip("_")
+    return _HEADER_NON_ALNUM.sub("_", text.strip().lower()).strip("_")
+
+
+def rows_to_dicts(headers: List[str], rows: List[List[str]]) -> List[Dict[str, str]]:
+    """
+    Map table rows onto header keys, skipping rows with fewer than two cells.
+    Rows whose width does not match the headers fall back to ``col_<index>`` keys.
+    """
+    records: List[Dict[str, str]] = []
+    width = len(headers)
+    for cells in rows:
+        if len(cells) < 2:
+            continue
+        if width and width == len(cells):
+            records.append(dict(zip(headers, cells)))
+        else:
+            records.append({f"col_{i}": cell for i, cell in enumerate(cells)})
+    return records
@@ -4,6 +4,12 @@ Diagnostic helpers to determine which scraping strategy to use.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -11,12 +17,12 @@ from bs4 import BeautifulSoup
 from bs4.element import Tag
 
 from .common import build_url
+from .http_scraper import build_session
 
 AJAX_INDICATORS = ("ajax", "fetch", "xmlhttprequest", "axios", "jquery", "react", "angular", "vue")
 
 
-def _summarize_table(table: Tag) -> Dict[str, Any]:
-    rows = table.find_all("tr")
+def _summarize_table(table: Tag, rows: List[Tag]) -> Dict[str, Any]:
     summary: Dict[str, Any] = {
         "rows": len(rows),
         "class": table.get("class"),
@@ -31,12 +37,8 @@ def _summarize_table(table: Tag) -> Dict[str, Any]:
     return summary
 
 
-def analyze_page(team_id: str, page_type: str, label: str, **params: str) -> Dict[str, Any]:
-    """
-    Fetch a page and inspect the structure to recommend a scraping strategy.
-    """
-    url = build_url(team_id, page_type, **params)
-    result: Dict[str, Any] = {
+def _new_result(label: str, url: str) -> Dict[str, Any]:
+    return {
         "label": label,
         "url": url,
         "success": False,
@@ -46,11 +48,25 @@ def analyze_page(team_id: str, page_type: str, label: str, **params: str) -> Dic
         "js_frameworks": [],
     }
 
+
+def _fetch(
+    session: requests.Session, url: str, headers: Optional[Dict[str, str]] = None
+) -> requests.Response | requests.RequestException:
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, headers=headers, timeout=10)
         response.raise_for_status()
     except requests.RequestException as exc:
-        result["error"] = str(exc)
+        return exc
+    return response
+
+
+def _analyze_response(
+    label: str, url: str, response: requests.Response | requests.RequestException
+) -> Dict[str, Any]:
+    result = _new_result(label, url)
+
+    if isinstance(response, requests.RequestException):
+        result["error"] = str(response)
         return result
 
     result["success"] = True
@@ -59,11 +75,12 @@ def analyze_page(team_id: str, page_type: str, label: str, **params: str) -> Dic
 
     soup = BeautifulSoup(response.text, "html.parser")
     tables = soup.find_all("table")
+    table_rows = [table.find_all("tr") for table in tables]
     result["tables"] = len(tables)
-    result["table_info"] = [_summarize_table(table) for table in tables]
+    result["table_info"] = [_summarize_table(table, rows) for table, rows in zip(tables, table_rows)]
 
     # Determine scraping method
-    if tables and any(len(table.find_all("tr")) > 1 for table in tables):
+    if any(len(rows) > 1 for rows in table_rows):
         result["method"] = "beautifulsoup"
     else:
         result["method"] = "playwright"
@@ -74,19 +91,120 @@ def analyze_page(team_id: str, page_type: str, label: str, **params: str) -> Dic
     return result
 
 
-def run_diagnostics(team_id: str = "DSMALL") -> Dict[str, Dict[str, Any]]:
+def _load_diag_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_diag_cache(path: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        print(f"Warning: could not write diagnostics cache {path}: {exc}")
+
+
+def _conditional_headers(entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    if not entry:
+        return None
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers or None
+
+
+def _cached_or_analyzed(
+    label: str,
+    url: str,
+    response: requests.Response | requests.RequestException,
+    cache: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Reuse the cached result when the server answers 304 or the body hashes the same as
+    last time; otherwise analyze the page and refresh its cache entry.
+    """
+    if isinstance(response, requests.RequestException):
+        return _analyze_response(label, url, response)
+
+    entry = cache.get(url)
+    if entry is not None and response.status_code == 304:
+        return entry["result"]
+
+    digest = hashlib.sha256(response.content).hexdigest()
+    if entry is not None and entry.get("content_sha256") == digest:
+        result = entry["result"]
+    else:
+        result = _analyze_response(label, url, response)
+    cache[url] = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_sha256": digest,
+        "result": result,
+    }
+    return result
+
+
+def _session_scope(session: Optional[requests.Session]):
+    """Use the caller's session as-is, or a fresh pooled one that is closed afterwards."""
+    return nullcontext(session) if session is not None else build_session()
+
+
+def analyze_page(
+    team_id: str,
+    page_type: str,
+    label: str,
+    session: Optional[requests.Session] = None,
+    **params: str,
+) -> Dict[str, Any]:
+    """
+    Fetch a page and inspect the structure to recommend a scraping strategy.
+    """
+    url = build_url(team_id, page_type, **params)
+    with _session_scope(session) as active:
+        response = _fetch(active, url)
+    return _analyze_response(label, url, response)
+
+
+def run_diagnostics(
+    team_id: str = "DSMALL",
+    session: Optional[requests.Session] = None,
+    cache_path: Optional[Path] = None,
+) -> Dict[str, Dict[str, Any]]:
     """
     Run diagnostics on the schedule, stats, and standings pages.
+
+    The pages are fetched concurrently over a shared session (a pooled one is
+    created when none is passed); parsing happens afterwards on the calling thread.
+
+    With ``cache_path``, each page's ETag/Last-Modified, body hash, and result are
+    kept in that JSON file; later runs send conditional requests and skip parsing
+    pages that are unchanged.
     """
     pages = (
         ("schedule", "Schedule", {"format": "List", "d": "ALL"}),
         ("stats", "Player Statistics", {"psort": "points"}),
         ("standings", "Standings", {}),
     )
+    urls = [build_url(team_id, page_type, **params) for page_type, _, params in pages]
+    cache = _load_diag_cache(cache_path) if cache_path is not None else {}
+    headers = [_conditional_headers(cache.get(url)) for url in urls]
+
+    with _session_scope(session) as active, ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(lambda url, hdrs: _fetch(active, url, hdrs), urls, headers))
 
     results: Dict[str, Dict[str, Any]] = {}
-    for page_type, label, params in pages:
-        results[label] = analyze_page(team_id, page_type, label, **params)
+    for (_, label, _), url, response in zip(pages, urls, responses):
+        results[label] = _cached_or_analyzed(label, url, response, cache)
+    if cache_path is not None:
+        _save_diag_cache(cache_path, cache)
     return results
 
 
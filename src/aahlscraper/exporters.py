@@ -4,33 +4,128 @@ Data export helpers for AAHL scraper outputs.
 
 from __future__ import annotations
 
+import csv
 import json
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Mapping, Sequence
+from typing import BinaryIO, Iterable, Iterator, Mapping, Sequence
 
-import pandas as pd
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZSTD_SUFFIX = ".zst"
+# Characters json.dumps escapes by default (ensure_ascii) but orjson writes raw.
+_NON_ASCII = re.compile("[\x7f-\U0010ffff]+")
+# Floats json.dumps writes in exponent form: orjson spells them 1e-7/1e16 (not 1e-07/1e+16)
+# or, below 1e-4, as 0.00001. A match inside a string only costs a slower, identical encode.
+_EXPONENT = re.compile(rb"\de|0\.0000")
 
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+@contextmanager
+def _open_output(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a binary output stream, compressing with zstd when the path ends in ``.zst``.
+    """
+    if path.suffix != ZSTD_SUFFIX:
+        with path.open("wb") as handle:
+            yield handle
+        return
+
+    if zstandard is None:
+        raise ImportError("Writing .zst exports requires zstandard. Install with: pip install zstandard")
+    with path.open("wb") as raw, zstandard.ZstdCompressor(level=3).stream_writer(raw) as writer:
+        yield writer
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    return json.dumps(match.group(0))[1:-1]
+
+
+def json_bytes(payload: object) -> bytes:
+    """
+    Serialize ``payload`` as indented JSON, using orjson when it is installed.
+
+    The bytes are the same either way: orjson output is escaped to ASCII like
+    json.dumps, and payloads with exponent floats (``1e-7`` vs ``1e-07``) are
+    encoded by json.dumps, so committed data does not churn between environments.
+    NaN and infinity are the exception: orjson writes them as ``null``.
+    """
+    if _HAS_ORJSON:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        if _EXPONENT.search(data):
+            return json.dumps(payload, indent=2).encode("utf-8")
+        if data.isascii() and b"\x7f" not in data:
+            return data
+        return _NON_ASCII.sub(_escape_non_ascii, data.decode("utf-8")).encode("ascii")
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
 def export_json(records: Sequence[Mapping], path: Path) -> None:
     """
-    Persist a sequence of mapping-like records to JSON.
+    Persist a sequence of mapping-like records to JSON (zstd-compressed for ``.zst`` paths).
     """
     _ensure_parent(path)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(list(records), handle, indent=2)
+    with _open_output(path) as handle:
+        # One encoded write instead of json.dump's stream of tiny token writes.
+        handle.write(json_bytes(list(records)))
+
+
+def write_json(payload: object, path: Path) -> None:
+    """
+    Persist an arbitrary JSON document (indented), using orjson when it is installed.
+    """
+    _ensure_parent(path)
+    path.write_bytes(json_bytes(payload))
+
+
+def _dump_indented(record: Mapping) -> bytes:
+    data = json_bytes(record)
+    # Nest one level deeper so the output matches json.dump(list, indent=2).
+    return b"  " + data.replace(b"\n", b"\n  ")
+
+
+def export_json_stream(records: Iterable[Mapping], path: Path) -> None:
+    """
+    Write records to a JSON array one at a time instead of materialising the full list.
+
+    The output is byte-for-byte what ``export_json`` produces for the same records.
+    """
+    _ensure_parent(path)
+    with _open_output(path) as handle:
+        first = True
+        for record in records:
+            handle.write(b"[\n" if first else b",\n")
+            handle.write(_dump_indented(record))
+            first = False
+        handle.write(b"[]" if first else b"\n]")
 
 
 def export_csv(records: Sequence[Mapping], path: Path) -> None:
     """
-    Persist a sequence of mapping-like records to CSV using pandas.
+    Persist a sequence of mapping-like records to CSV.
+
+    Columns are the union of record keys in first-seen order; missing values are left blank.
     """
     if not records:
         return
 
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
     _ensure_parent(path)
-    frame = pd.DataFrame(records)
-    frame.to_csv(path, index=False)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
@@ -5,14 +5,18 @@ HTTP-based scraper implementation for the Amherst Adult Hockey League site.
 from __future__ import annotations
 
 import re
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .common import build_url, find_best_table, normalize_header
+from .cache import ResponseCache
+from .common import build_url, find_best_table_rows, normalize_header, rows_to_dicts
 from .models import GameRecord, TeamRoster
 from .parsers import (
     CALENDAR_URL,
@@ -32,12 +36,29 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+
+def build_session() -> requests.Session:
+    """
+    Create a keep-alive session with pooled connections and retrying transient failures.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
 TABLE_CLASS_CANDIDATES = ("table", "schedule-table", "data-table", "stats-table", "standings-table")
 
 
-def _extract_rows(table: Tag) -> List[List[str]]:
+def _extract_rows(table_rows: Iterable[Tag]) -> List[List[str]]:
     rows: List[List[str]] = []
-    for row in table.find_all("tr"):
+    for row in table_rows:
         cells = row.find_all(["td", "th"])
         if not cells:
             continue
@@ -79,32 +100,46 @@ class AmherstHockeyScraper:
         team_id: str = "DSMALL",
         session: Optional[requests.Session] = None,
         timeout: int = 10,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         self.team_id = team_id
-        self.session = session or requests.Session()
+        self.session = session or build_session()
         self.timeout = timeout
+        self.cache = cache
         self.session.headers.update(DEFAULT_HEADERS)
         self._game_cache: Optional[List[GameRecord]] = None
         self._roster_cache: Optional[Dict[str, TeamRoster]] = None
         self._player_lookup: Optional[Dict[Tuple[str, str], Dict[str, object]]] = None
+        # Guard the lazy caches above so concurrent scrape_* calls share one fetch.
+        self._games_lock = threading.Lock()
+        self._roster_lock = threading.RLock()
 
     def _fetch_soup(self, page_type: str, **params: str) -> Optional[BeautifulSoup]:
         url = build_url(self.team_id, page_type, **params)
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            print(f"Error requesting {page_type}: {exc}")
+        text = self._fetch_text(url, label=page_type)
+        if text is None:
             return None
-        return BeautifulSoup(response.text, "html.parser")
+        return BeautifulSoup(text, "html.parser")
 
-    def _fetch_text(self, url: str, *, params: Optional[Dict[str, str]] = None) -> Optional[str]:
+    def _fetch_text(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        label: Optional[str] = None,
+    ) -> Optional[str]:
+        if self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
         except requests.RequestException as exc:
-            print(f"Error requesting {url}: {exc}")
+            print(f"Error requesting {label or url}: {exc}")
             return None
+        if self.cache is not None:
+            self.cache.set(url, response.text, params)
         return response.text
 
     def _fetch_calendar(self) -> Optional[str]:
@@ -118,66 +153,69 @@ class AmherstHockeyScraper:
         return self._fetch_text(build_url(self.team_id, "roster"), params={"expandAll": "1"})
 
     def _load_rosters(self) -> Dict[str, TeamRoster]:
-        if self._roster_cache is not None:
-            return self._roster_cache
+        with self._roster_lock:
+            if self._roster_cache is not None:
+                return self._roster_cache
 
-        html = self._fetch_roster_page()
-        if not html:
-            self._roster_cache = {}
-            return {}
+            html = self._fetch_roster_page()
+            if not html:
+                self._roster_cache = {}
+                return {}
 
-        self._roster_cache = parse_rosters(html)
-        return self._roster_cache
+            self._roster_cache = parse_rosters(html)
+            return self._roster_cache
 
     def _build_player_lookup(self) -> Dict[Tuple[str, str], Dict[str, object]]:
-        if self._player_lookup is not None:
-            return self._player_lookup
+        with self._roster_lock:
+            if self._player_lookup is not None:
+                return self._player_lookup
+
+            rosters = self._load_rosters()
+            lookup: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
+
+            for team_slug, roster in rosters.items():
+                for player in roster.players:
+                    payload = {
+                        "player_id": player.player_id,
+                        "number": player.number,
+                        "team_id": roster.team_id,
+                        "team_name": roster.team_name,
+                        "positions": player.positions,
+                    }
+                    for key in player_name_variants(player.name):
+                        lookup.setdefault((team_slug, key), payload)
 
-        rosters = self._load_rosters()
-        lookup: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
-
-        for team_slug, roster in rosters.items():
-            for player in roster.players:
-                payload = {
-                    "player_id": player.player_id,
-                    "number": player.number,
-                    "team_id": roster.team_id,
-                    "team_name": roster.team_name,
-                    "positions": player.positions,
-                }
-                for key in player_name_variants(player.name):
-                    lookup.setdefault((team_slug, key), payload)
-
-        self._player_lookup = lookup
-        return lookup
+            self._player_lookup = lookup
+            return lookup
 
     def _load_games(self) -> List[GameRecord]:
-        if self._game_cache is not None:
-            return list(self._game_cache)
+        with self._games_lock:
+            if self._game_cache is not None:
+                return list(self._game_cache)
 
-        calendar_text = self._fetch_calendar()
-        if not calendar_text:
-            self._game_cache = []
-            return []
+            calendar_text = self._fetch_calendar()
+            if not calendar_text:
+                self._game_cache = []
+                return []
 
-        games = parse_ics_games(calendar_text, location_filter="Amherst")
+            games = parse_ics_games(calendar_text, location_filter="Amherst")
 
-        scores_html = self._fetch_scores_page()
-        if scores_html:
-            scoreboard_entries = [
-                entry for entry in parse_scoreboard(scores_html) if "amherst" in (entry.location or "").lower()
-            ]
-            games = merge_games_with_scores(games, scoreboard_entries)
+            scores_html = self._fetch_scores_page()
+            if scores_html:
+                scoreboard_entries = [
+                    entry for entry in parse_scoreboard(scores_html) if "amherst" in (entry.location or "").lower()
+                ]
+                games = merge_games_with_scores(games, scoreboard_entries)
 
-        games.sort(
-            key=lambda g: (
-                g.start_local
-                or g.start_utc
-                or datetime.max.replace(tzinfo=timezone.utc)  # type: ignore[arg-type]
+            games.sort(
+                key=lambda g: (
+                    g.start_local
+                    or g.start_utc
+                    or datetime.max.replace(tzinfo=timezone.utc)  # type: ignore[arg-type]
+                )
             )
-        )
-        self._game_cache = games
-        return list(self._game_cache)
+            self._game_cache = games
+            return list(self._game_cache)
 
     def scrape_schedule(self) -> List[Dict[str, object]]:
         """
@@ -204,12 +242,12 @@ class AmherstHockeyScraper:
         if soup is None:
             return []
 
-        table = find_best_table(soup, TABLE_CLASS_CANDIDATES)
+        table, table_rows = find_best_table_rows(soup, TABLE_CLASS_CANDIDATES)
         if table is None:
             print("No stats table found")
             return []
 
-        rows = _extract_rows(table)
+        rows = _extract_rows(table_rows)
         if not rows:
             return []
 
@@ -218,16 +256,8 @@ class AmherstHockeyScraper:
 
         lookup = self._build_player_lookup()
 
-        players: List[Dict[str, str]] = []
-        for cells in data_rows:
-            if len(cells) < 2:
-                continue
-
-            if headers and len(headers) == len(cells):
-                player = {headers[i]: cells[i] for i in range(len(cells))}
-            else:
-                player = {f"col_{i}": cell for i, cell in enumerate(cells)}
-
+        players: List[Dict[str, str]] = rows_to_dicts(headers, data_rows)
+        for player in players:
             name_field = (
                 player.get("name")
                 or player.get("player")
@@ -256,8 +286,6 @@ class AmherstHockeyScraper:
                 player["player_id"] = None
             player["team_slug"] = team_slug or None
 
-            players.append(player)
-
         return players
 
     def scrape_standings(self) -> List[Dict[str, str]]:
@@ -265,28 +293,20 @@ class AmherstHockeyScraper:
         if soup is None:
             return []
 
-        table = find_best_table(soup, TABLE_CLASS_CANDIDATES)
+        table, table_rows = find_best_table_rows(soup, TABLE_CLASS_CANDIDATES)
         if table is None:
             print("No standings table found")
             return []
 
-        rows = _extract_rows(table)
+        rows = _extract_rows(table_rows)
         if not rows:
             return []
 
         headers: List[str] = [normalize_header(cell) for cell in rows[0]]
         data_rows = rows[1:] if len(rows) > 1 else rows
 
-        standings: List[Dict[str, str]] = []
-        for cells in data_rows:
-            if len(cells) < 2:
-                continue
-
-            if headers and len(headers) == len(cells):
-                team = {headers[i]: cells[i] for i in range(len(cells))}
-            else:
-                team = {f"col_{i}": cell for i, cell in enumerate(cells)}
-
+        standings: List[Dict[str, str]] = rows_to_dicts(headers, data_rows)
+        for team in standings:
             record_text = str(team.get("record") or "")
             wins_record, losses_record, ties_record = _parse_record_numbers(record_text)
 
@@ -313,8 +333,6 @@ class AmherstHockeyScraper:
             if ties_val is not None:
                 team["ties"] = ties_val
 
-            standings.append(team)
-
         return standings
 
     def scrape_results(self) -> List[Dict[str, object]]:
@@ -8,25 +8,26 @@ from typing import Dict, List, Optional, Tuple
 
 from playwright.sync_api import sync_playwright
 
-from .common import build_url, normalize_header
+from .common import build_url, normalize_header, rows_to_dicts
 from .http_scraper import AmherstHockeyScraper
 from .utils import player_name_variants, slugify
 
 EXTRACT_ROWS_SCRIPT = """
-() => {
-  const table = document.querySelector('table');
-  if (!table) {
-    return [];
-  }
-
-  const rows = Array.from(table.querySelectorAll('tr'));
-  return rows.map(row => {
-    const cells = Array.from(row.querySelectorAll('td, th'));
-    return cells.map(cell => cell.textContent.trim());
-  }).filter(row => row.length > 0);
-}
+rows => rows
+  .map(row => Array.from(row.querySelectorAll('td, th'), cell => cell.textContent.trim()))
+  .filter(cells => cells.length > 0)
 """
 
+# Resource types that never carry table data; aborting them lets the page settle sooner.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+
+def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
 
 class AmherstHockeyPlaywrightScraper:
     """
@@ -56,11 +57,12 @@ class AmherstHockeyPlaywrightScraper:
 
             browser = browser_factory.launch(headless=self.headless)
             page = browser.new_page()
+            page.route("**/*", _block_heavy_resources)
 
             try:
-                page.goto(url, wait_until="networkidle")
-                page.wait_for_selector("table", timeout=self.timeout_ms)
-                return page.evaluate(EXTRACT_ROWS_SCRIPT)
+                page.goto(url, wait_until="domcontentloaded")
+                page.wait_for_selector("table tr", timeout=self.timeout_ms)
+                return page.locator("table").first.locator("tr").evaluate_all(EXTRACT_ROWS_SCRIPT)
             except Exception as exc:
                 print(f"Error scraping {page_type} with Playwright: {exc}")
                 return []
@@ -129,17 +131,7 @@ class AmherstHockeyPlaywrightScraper:
         headers = [normalize_header(cell) for cell in rows[0]]
         data_rows = rows[1:] if len(rows) > 1 else rows
 
-        players: List[Dict[str, str]] = []
-        for cells in data_rows:
-            if len(cells) < 2:
-                continue
-
-            if headers and len(headers) == len(cells):
-                player = {headers[i]: cells[i] for i in range(len(cells))}
-            else:
-                player = {f"col_{i}": cell for i, cell in enumerate(cells)}
-
-            players.append(player)
+        players: List[Dict[str, str]] = rows_to_dicts(headers, data_rows)
 
         lookup = self._ensure_player_lookup()
         for player in players:
@@ -177,15 +169,4 @@ class AmherstHockeyPlaywrightScraper:
         headers = [normalize_header(cell) for cell in rows[0]]
         data_rows = rows[1:] if len(rows) > 1 else rows
 
-        standings: List[Dict[str, str]] = []
-        for cells in data_rows:
-            if len(cells) < 2:
-                continue
-
-            if headers and len(headers) == len(cells):
-                team = {headers[i]: cells[i] for i in range(len(cells))}
-            else:
-                team = {f"col_{i}": cell for i, cell in enumerate(cells)}
-            standings.append(team)
-
-        return standings
+        return rows_to_dicts(headers, data_rows)
@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Iterable, List, Optional, Tuple
 
 DATE_FORMATS: Iterable[str] = ("%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%m/%d/%y")
 
 
+@lru_cache(maxsize=512)
 def parse_game_date(raw: str) -> Optional[datetime]:
     """
     Attempt to parse a date string using the known set of formats.
@@ -28,6 +30,7 @@ _SLUG_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 _PLAYER_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 
+@lru_cache(maxsize=2048)
 def slugify(raw: str) -> str:
     """
     Convert freeform text into a filesystem and URL friendly slug.
@@ -40,6 +43,7 @@ def slugify(raw: str) -> str:
     return value or "unnamed"
 
 
+@lru_cache(maxsize=8192)
 def normalize_player_key(name: str) -> str:
     """
     Produce a slug-like key for matching player names across data sources.
@@ -50,9 +54,12 @@ def normalize_player_key(name: str) -> str:
     return _PLAYER_NON_ALNUM.sub("-", value)
 
 
-def player_name_variants(name: str) -> List[str]:
+@lru_cache(maxsize=8192)
+def player_name_variants(name: str) -> Tuple[str, ...]:
     """
     Return normalized name variants (e.g. 'Last, First' and 'First Last').
+
+    Results are cached, so a tuple is returned to keep callers from mutating them.
     """
 
     cleaned = (name or "").strip()
@@ -66,7 +73,7 @@ def player_name_variants(name: str) -> List[str]:
             first = " ".join(parts[:-1])
             last = parts[-1]
             variants.add(normalize_player_key(f"{last}, {first}"))
-    return [variant for variant in variants if variant]
+    return tuple(variant for variant in variants if variant)
 
 
 _ROSTER_CAPTAIN_PATTERNS: List[Tuple[str, re.Pattern[str]]] = [
@@ -112,6 +119,11 @@ def derive_player_id(team_slug: str, name: str, number: Optional[str] = None) ->
     Generate a stable player identifier scoped to a team.
     """
 
+    return _derive_player_id_cached(team_slug, name, str(number) if number else "")
+
+
+@lru_cache(maxsize=4096)
+def _derive_player_id_cached(team_slug: str, name: str, number: str) -> str:
     base = slugify(name.replace(",", " "))
     number_fragment = ""
     if number: